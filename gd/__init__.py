@@ -0,0 +1 @@
+"""Módulos compartidos por las variantes geo5.x del juego."""
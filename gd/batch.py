@@ -0,0 +1,210 @@
+"""Simulador por lotes con NumPy: miles de partidas en paralelo.
+
+`BatchSimulation` guarda el estado de N partidas en arrays (jugador y
+obstáculos) y las avanza todas a la vez con operaciones vectorizadas.
+Reproduce tick a tick las reglas de `gd.core.Simulation` con colisión por
+rectángulos (exige `Config(pixel_collision=False)`) y la misma semilla: cada
+partida usa su propio flujo `RunRandom.obstacles`, que solo se consulta en
+los ticks en que aparece un obstáculo.
+
+Cada partida puede tener su propia `Config`, así que sirve para barrer
+GRAVITY, JUMP_VELOCITY, OBSTACLE_FREQ o los rangos de tamaño. No admite
+las variantes con pantalla GAME OVER ni la rotación "center" (el
+rectángulo del jugador cambia de tamaño con cada frame).
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError("gd.batch necesita NumPy (pip install numpy)") from exc
+
+from gd.core import (CULL_X, FIRST_TRANSITION_TICKS, LEVEL_TRANSITION_TICKS, PLAYER_SIZE,
+                     PLAYER_X, RESTART_TICKS, Config, RunRandom, choose_obstacle)
+from gd.jumps import FairSpawner
+
+
+def _round_rect(v):
+    """Redondeo de `pygame.Rect` al asignar floats (mitades lejos de cero)."""
+    return np.where(v >= 0, np.floor(v + 0.5), np.ceil(v - 0.5)).astype(np.int64)
+
+
+class BatchSimulation:
+    def __init__(self, configs, seeds):
+        seeds = list(seeds)
+        n = len(seeds)
+        if isinstance(configs, Config):
+            configs = [configs] * n
+        configs = list(configs)
+        if len(configs) != n:
+            raise ValueError("hace falta una Config por semilla")
+        for c in configs:
+            if c.pixel_collision:
+                # Solo hay colisión por rectángulos: con máscaras se separaría de Simulation
+                raise ValueError("BatchSimulation necesita pixel_collision=False")
+            if c.game_over or c.freeze_on_crash or c.rotation == "center":
+                raise ValueError("BatchSimulation no admite game_over, freeze_on_crash ni rotation='center'")
+        self.n = n
+        self.configs = configs
+        self.rngs = [RunRandom(seed) for seed in seeds]
+        self.spawners = [FairSpawner(c) if c.fair_spawns else None for c in configs]
+
+        def param(name, dtype=np.float64):
+            return np.array([getattr(c, name) for c in configs], dtype=dtype)
+
+        # Parámetros por partida
+        self.gravity = param("gravity")
+        self.jump_velocity = param("jump_velocity")
+        self.ground_y = np.array([c.ground_y for c in configs], dtype=np.int64)
+        self.scroll_speed_base = param("scroll_speed_base")
+        self.speed_per_level = param("speed_per_level")
+        self.obstacle_ticks = np.array([c.obstacle_ticks for c in configs])
+        self.score_speed = param("score_speed")
+        self.score_factor = np.array([c.tick_ms / 16.6667 for c in configs])
+        self.level_distance = np.array([c.level_distance for c in configs], dtype=np.int64)
+        self.level_distance_growth = param("level_distance_growth")
+        self.spawn_x = np.array([c.width + 20 for c in configs], dtype=np.int64)
+
+        # Estado del jugador
+        self.y = self.ground_y - PLAYER_SIZE
+        self.vel_y = np.zeros(n)
+        self.on_ground = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+
+        # Estado de la partida
+        self.ticks = 0
+        self.level = np.ones(n, dtype=np.int64)
+        self.distance = np.zeros(n)
+        self.best_distance = np.zeros(n, dtype=np.int64)
+        self.crashes = np.zeros(n, dtype=np.int64)
+        self.scroll_speed = self.scroll_speed_base.copy()
+        self.last_obstacle_tick = np.zeros(n, dtype=np.int64)
+        self.game_active = np.ones(n, dtype=bool)
+        self.show_level_transition = np.ones(n, dtype=bool)
+        self.transition_timer = np.full(n, FIRST_TRANSITION_TICKS, dtype=np.int64)
+        self.auto_restart_timer = np.zeros(n, dtype=np.int64)
+
+        # Obstáculos: K huecos por partida (crece si hace falta)
+        k = max(self._slots_needed(c) for c in configs)
+        self.ob_active = np.zeros((n, k), dtype=bool)
+        self.ob_x = np.zeros((n, k), dtype=np.int64)
+        self.ob_w = np.zeros((n, k), dtype=np.int64)
+        self.ob_h = np.zeros((n, k), dtype=np.int64)
+        self.ob_kind = np.zeros((n, k), dtype=np.int8)  # 0 = spike, 1 = block
+
+        self.reset(np.arange(n))
+
+    @staticmethod
+    def _slots_needed(cfg):
+        gap = max(1.0, math.floor(cfg.obstacle_ticks + 1) * cfg.scroll_speed_base)
+        widest = max(cfg.spike_width[1], cfg.block_width[1])
+        return int((cfg.width + 20 - CULL_X + widest) / gap) + 2
+
+    def reset(self, idx):
+        """Equivalente vectorizado de `Simulation.reset_game` para las partidas `idx`."""
+        if len(idx) == 0:
+            return
+        for i in idx:
+            self.rngs[i].reseed(int(self.level[i]))
+            if self.spawners[i] is not None:
+                self.spawners[i].reset()
+        self.ob_active[idx] = False
+        self.y[idx] = self.ground_y[idx] - PLAYER_SIZE
+        self.vel_y[idx] = 0
+        self.alive[idx] = True
+        self.scroll_speed[idx] = self.scroll_speed_base[idx] + (self.level[idx] - 1) * self.speed_per_level[idx]
+        self.distance[idx] = 0
+        self.last_obstacle_tick[idx] = self.ticks
+        self.game_active[idx] = True
+
+    def _spawn(self, i):
+        choice = choose_obstacle(self.configs[i], self.rngs[i].obstacles, self.spawners[i],
+                                 self.ticks, float(self.scroll_speed[i]))
+        if choice is None:
+            return
+        kind, h, w = choice
+        free = np.flatnonzero(~self.ob_active[i])
+        if len(free) == 0:
+            self._grow()
+            free = np.flatnonzero(~self.ob_active[i])
+        j = free[0]
+        self.ob_active[i, j] = True
+        self.ob_x[i, j] = self.spawn_x[i]
+        self.ob_w[i, j] = w
+        self.ob_h[i, j] = h
+        self.ob_kind[i, j] = 0 if kind == "spike" else 1
+
+    def _grow(self):
+        k = self.ob_active.shape[1]
+        pad = ((0, 0), (0, k))
+        self.ob_active = np.pad(self.ob_active, pad)
+        self.ob_x = np.pad(self.ob_x, pad)
+        self.ob_w = np.pad(self.ob_w, pad)
+        self.ob_h = np.pad(self.ob_h, pad)
+        self.ob_kind = np.pad(self.ob_kind, pad)
+
+    def step(self, jump):
+        """Avanza un tick todas las partidas. `jump` es un array bool de N (o un bool)."""
+        jump = np.broadcast_to(np.asarray(jump, dtype=bool), (self.n,))
+        self.ticks += 1
+
+        can_jump = jump & self.game_active & self.on_ground & self.alive
+        self.vel_y[can_jump] = self.jump_velocity[can_jump]
+
+        # ---------- TRANSICIÓN DE NIVEL ----------
+        tr = self.show_level_transition
+        self.transition_timer[tr] -= 1
+        self.show_level_transition = tr & (self.transition_timer > 0)
+
+        running = self.game_active & ~self.show_level_transition
+        restarting = ~self.game_active
+
+        # ---------- JUGADOR ----------
+        upd = running | restarting
+        self.vel_y[upd] += self.gravity[upd]
+        self.y[upd] += np.trunc(self.vel_y[upd]).astype(np.int64)
+        landed = upd & (self.y + PLAYER_SIZE >= self.ground_y)
+        self.y[landed] = self.ground_y[landed] - PLAYER_SIZE
+        self.vel_y[landed] = 0
+        self.on_ground[upd] = landed[upd]
+
+        # ---------- OBSTÁCULOS ----------
+        moving = self.ob_active & running[:, None]
+        moved = _round_rect(self.ob_x - self.scroll_speed[:, None])
+        self.ob_x = np.where(moving, moved, self.ob_x)
+        self.ob_active &= ~(moving & (self.ob_x + self.ob_w < CULL_X))
+
+        # Colisión AABB (como `Rect.colliderect`)
+        py = self.y[:, None]
+        ob_top = self.ground_y[:, None] - self.ob_h
+        overlap = (self.ob_active
+                   & (self.ob_x < PLAYER_X + PLAYER_SIZE) & (PLAYER_X < self.ob_x + self.ob_w)
+                   & (ob_top < py + PLAYER_SIZE) & (py < self.ground_y[:, None]))
+        hit = running & overlap.any(axis=1)
+        self.alive[hit] = False
+        self.game_active[hit] = False
+        self.auto_restart_timer[hit] = RESTART_TICKS
+        self.crashes += hit
+        self.best_distance[hit] = np.maximum(self.best_distance[hit], self.distance[hit].astype(np.int64))
+
+        # Generar obstáculos (pocas partidas por tick: bucle en Python)
+        due = running & (self.ticks - self.last_obstacle_tick > self.obstacle_ticks)
+        self.last_obstacle_tick[due] = self.ticks
+        for i in np.flatnonzero(due):
+            self._spawn(i)
+
+        # Distancia y fin de nivel
+        score_speed = np.where(self.score_speed != 0, self.score_speed, self.scroll_speed)
+        self.distance[running] += score_speed[running] * self.score_factor[running]
+        done = running & (self.distance >= self.level_distance)
+        if done.any():
+            self.level[done] += 1
+            grown = self.level_distance[done] * self.level_distance_growth[done]
+            self.level_distance[done] = grown.astype(np.int64)
+            self.show_level_transition[done] = True
+            self.transition_timer[done] = LEVEL_TRANSITION_TICKS
+            self.reset(np.flatnonzero(done))
+
+        # ---------- AUTO-REINICIO ----------
+        self.auto_restart_timer[restarting] -= 1
+        self.reset(np.flatnonzero(restarting & (self.auto_restart_timer <= 0)))
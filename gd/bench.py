@@ -0,0 +1,235 @@
+"""Benchmarks de los caminos calientes del bucle de juego, sin ventana.
+
+Usa el driver de video "dummy" de SDL, así que corre igual en CI que en
+un equipo sin pantalla. Cada benchmark se mide por preset para comparar
+variantes; los resultados se pueden guardar como línea base y comparar
+después para detectar regresiones:
+
+    python -m gd.bench --preset all --save bench_baseline.json
+    python -m gd.bench --preset all --compare bench_baseline.json --tolerance 0.15
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from gd.bot import ScriptedBot
+from gd.core import PLAYER_SIZE, PLAYER_X, Obstacle, ObstaclePool, Player, Simulation
+from gd.presets import get_preset, preset_names
+from gd.profiler import counters, format_counters
+from gd.render import DirtyRenderer, Renderer
+from gd.text import TextCache
+
+BENCHMARKS = {}  # nombre -> setup(config, screen) que devuelve la operación a medir
+
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# ---------- BENCHMARKS ----------
+@benchmark("draw_text")
+def bench_draw_text(config, screen):
+    text_cache = TextCache()
+    count = iter(range(10**12))
+    def op():
+        text_cache.draw(screen, f"Progreso: {next(count) % 10000}/{config.level_distance}", 20, 12, 38)
+    return op
+
+
+@benchmark("player_update")
+def bench_player_update(config, screen):
+    player = Player(PLAYER_X, config.ground_y - PLAYER_SIZE, config)
+    def op():
+        if player.on_ground:
+            player.jump()  # siempre en el aire o aterrizando: ejercita la rotación
+        player.update()
+    return op
+
+
+@benchmark("obstacle_new")
+def bench_obstacle_new(config, screen):
+    sizes = [(w, h) for w in range(*config.spike_width) for h in range(*config.spike_height)] or [(40, 40)]
+    count = iter(range(10**12))
+    def op():
+        w, h = sizes[next(count) % len(sizes)]
+        Obstacle(config.width + 20, config.ground_y, "spike", h, w)
+    return op
+
+
+@benchmark("obstacle_pool")
+def bench_obstacle_pool(config, screen):
+    pool = ObstaclePool()
+    sizes = [(w, h) for w in range(*config.spike_width) for h in range(*config.spike_height)] or [(40, 40)]
+    count = iter(range(10**12))
+    def op():
+        w, h = sizes[next(count) % len(sizes)]
+        pool.release(pool.acquire(config.width + 20, config.ground_y, "spike", h, w))
+    return op
+
+
+def collision_setup(n):
+    def setup(config, screen):
+        sim = Simulation(config, seed=0)
+        sim.obstacles.empty()
+        prect = sim.player.rect
+        # Casi choque: la base del cubo entra 8 px en las esquinas vacías de dos
+        # pinchos, así que los rectángulos se tocan y se comparan las máscaras
+        prect.bottom = config.ground_y - 45 + 8
+        xs = [prect.left - 40 + 8, prect.right - 8]
+        spacing = max(1, (config.width + 200) // n)
+        for i in range(n):
+            x = i * spacing - 40
+            if x >= prect.right or x + 40 <= prect.left:  # los demás, fuera de la ventana
+                xs.append(x)
+        for x in sorted(xs):
+            sim.obstacles.spawn(x, config.ground_y, "spike", 45, 40)
+        return sim.find_collision
+    return setup
+
+
+for _n in (10, 100, 1000):
+    benchmark(f"collision_{_n}")(collision_setup(_n))
+
+
+@benchmark("background")
+def bench_background(config, screen):
+    sim = Simulation(config, seed=0)
+    sim.scrolled = True
+    renderer = Renderer(screen, config, TextCache(), sim.rng)
+    return lambda: renderer.draw_background(sim)
+
+
+def frame_setup(renderer_cls):
+    def setup(config, screen):
+        sim = Simulation(config, seed=0)
+        bot = ScriptedBot(config)
+        renderer = renderer_cls(screen, config, TextCache(), sim.rng)
+        while sim.show_level_transition:
+            sim.step()  # empezar ya en juego, sin la capa de "NIVEL 1"
+        def op():
+            renderer.handle_events(sim.step(bot(sim), True))
+            renderer.draw(sim, 0.5, config.tick_ms)
+        op.counters = lambda: counters(sim, renderer, bot=bot)
+        return op
+    return setup
+
+
+benchmark("frame")(frame_setup(Renderer))
+benchmark("frame_dirty")(frame_setup(DirtyRenderer))
+
+
+@benchmark("cold_start")
+def bench_cold_start(config, screen):
+    # Proceso nuevo hasta el primer frame, incluido `import pygame`
+    name = next(n for n in preset_names() if get_preset(n) == config)
+    cmd = [sys.executable, "-m", "gd.engine", "--preset", name, "--frames", "1"]
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    return lambda: subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+# ---------- MEDICIÓN ----------
+def measure(op, min_time=0.2, repeat=5):
+    """Microsegundos por llamada: (mínimo, mediana) de `repeat` rondas."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        number *= 2
+    rounds = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        rounds.append(time.perf_counter() - start)
+    per_op = [r / number * 1e6 for r in rounds]
+    return min(per_op), statistics.median(per_op)
+
+
+def run(presets, pattern="*", min_time=0.2):
+    """Ejecuta los benchmarks que coinciden con `pattern` en cada preset."""
+    results = {}
+    for name in presets:
+        config = get_preset(name)
+        screen = pygame.display.set_mode((config.width, config.height))
+        for bench, setup in BENCHMARKS.items():
+            if not fnmatch.fnmatch(bench, pattern):
+                continue
+            op = setup(config, screen)
+            best, median = measure(op, min_time)
+            key = f"{name}/{bench}"
+            results[key] = {"min_us": round(best, 3), "median_us": round(median, 3)}
+            print(f"{key:<24}{best:12.2f} us{median:12.2f} us", flush=True)
+            if hasattr(op, "counters"):
+                # Tras miles de frames, las cachés deberían seguir acertando
+                print(f"{'':<24}{format_counters(op.counters())}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Lista de (clave, antes, ahora) de los benchmarks más lentos que la línea base."""
+    slower = []
+    for key, now in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        ratio = now["min_us"] / before["min_us"]
+        mark = "  REGRESIÓN" if ratio > 1 + tolerance else ""
+        print(f"{key:<24}{before['min_us']:12.2f} -> {now['min_us']:10.2f} us  x{ratio:.2f}{mark}")
+        if mark:
+            slower.append((key, before["min_us"], now["min_us"]))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del bucle de juego (sin ventana)")
+    parser.add_argument("--preset", nargs="+", default=["5.6"], help="presets a medir ('all' = todos)")
+    parser.add_argument("--filter", default="*", help="patrón de nombres, p. ej. 'collision_*'")
+    parser.add_argument("--min-time", type=float, default=0.2, help="segundos por benchmark")
+    parser.add_argument("--save", metavar="ARCHIVO", help="guarda los resultados como línea base")
+    parser.add_argument("--compare", metavar="ARCHIVO", help="compara con una línea base guardada")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="fracción de lentitud aceptada antes de marcar regresión")
+    args = parser.parse_args(argv)
+    presets = preset_names() if "all" in args.preset else args.preset
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    print(f"{'benchmark':<24}{'mínimo':>15}{'mediana':>15}")
+    results = run(presets, args.filter, args.min_time)
+    pygame.quit()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print()
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Jugadores automáticos para partidas sin pantalla.
+
+Un bot es un callable `bot(sim) -> bool` (saltar o no en el próximo tick).
+`bot_inputs()` lo convierte en la entrada tick a tick de `FixedTimestep`,
+así que también puede jugar con ventana (`--autopilot` en gd.engine).
+
+    python -m gd.bot --preset 5.6 --ticks 1000000     # prueba de resistencia
+"""
+import argparse
+import sys
+import time
+
+from gd.core import Simulation
+from gd.jumps import jump_table
+
+
+class ScriptedBot:
+    """Bot simple: salta cuando el siguiente obstáculo está a la distancia
+    justa para que la mitad del salto caiga sobre su centro.
+
+    El tiempo en el aire sale de GRAVITY y JUMP_VELOCITY de la config, así
+    que se adapta a cada variante sin ajustes a mano.
+    """
+
+    def __init__(self, config, horizon=400):
+        self.config = config
+        self.horizon = horizon
+        self.air_ticks = 2 * abs(config.jump_velocity) / config.gravity
+
+    def __call__(self, sim):
+        player = sim.player
+        if not (sim.game_active and player.on_ground):
+            return False
+        left = player.rect.right
+        for ob in sim.obstacles.window(left, left + self.horizon):
+            gap = ob.rect.left - left
+            if gap < 0:
+                continue
+            lead = self.air_ticks * sim.scroll_speed / 2 - (ob.width + player.size) / 2
+            return gap <= max(lead, sim.scroll_speed)
+        return False
+
+
+class AutopilotBot:
+    """Bot con anticipación: planifica los saltos con la `JumpTable` de la
+    variante contra los obstáculos visibles.
+
+    Para cada obstáculo calcula en qué ticks futuros solapará con el cubo y,
+    con el tramo del arco que pasa sobre su altura, el intervalo de ticks en
+    que hay que despegar. Una búsqueda corta reparte los obstáculos en
+    saltos (uno puede cubrir varios si están juntos) y salta ahora si el
+    plan más temprano empieza en este tick.
+    """
+
+    def __init__(self, config, horizon=None, max_obstacles=6):
+        self.config = config
+        self.table = jump_table(config)
+        # Lo bastante lejos para ver todo lo que solapará durante un salto
+        self.horizon = config.width + 40 if horizon is None else horizon
+        self.max_obstacles = max_obstacles
+        self.plans = 0
+
+    def windows(self, sim):
+        """[(desde, hasta)] en ticks desde ahora en que hay que despegar para
+        superar cada obstáculo visible (0 = en el próximo tick)."""
+        table = self.table
+        v = table.step(sim.scroll_speed)
+        result = []
+        for ob in sim.obstacles.window(table.left, table.left + self.horizon):
+            r = ob.rect
+            first_m = max(1, (r.x - table.right) // v + 1)
+            last_m = -(-(r.right - table.left) // v) - 1
+            if last_m < 1:
+                continue  # ya pasó
+            window = table.window(min(ob.height, table.top))
+            first, last = window
+            result.append((last_m - last, first_m - first))
+            if len(result) == self.max_obstacles:
+                break
+        return result
+
+    def plan(self, windows, i=0, ready=0):
+        """Tick del primer salto de un plan que supera `windows[i:]`, o None."""
+        if i == len(windows):
+            return ready
+        table = self.table
+        lo, hi = -10**9, 10**9
+        for j in range(i, len(windows)):
+            lo = max(lo, windows[j][0])
+            hi = min(hi, windows[j][1])
+            start = max(lo, ready)
+            if start > hi:
+                break
+            if self.plan(windows, j + 1, start + table.air_ticks + table.jump_gap - 1) is not None:
+                return start
+        return None
+
+    def __call__(self, sim):
+        player = sim.player
+        if not (sim.game_active and player.on_ground) or sim.show_level_transition:
+            return False
+        windows = self.windows(sim)
+        if not windows:
+            return False
+        self.plans += 1
+        start = self.plan(windows)
+        if start is None:
+            # Sin solución: apurar el último momento útil para el primero
+            return windows[0][1] <= 0
+        return start <= 0
+
+
+BOTS = {"scripted": ScriptedBot, "autopilot": AutopilotBot}
+
+
+def bot_inputs(bot, sim):
+    """Entrada (salto, continuar) tick a tick para `FixedTimestep(inputs=...)`."""
+    while True:
+        yield bot(sim), sim.show_game_over
+
+
+def soak(config, bot_name="autopilot", ticks=100000, seed=None):
+    """Juega `ticks` ticks sin pantalla y devuelve las métricas de la partida."""
+    sim = Simulation(config, seed=seed)
+    bot = BOTS[bot_name](config)
+    step = sim.step
+    crashes = 0
+    best = 0  # mayor distancia de un intento, con los niveles que completó
+    carried = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        goal = sim.level_distance
+        events = step(bot(sim), sim.show_game_over)
+        if "crash" in events:
+            crashes += 1
+            best = max(best, carried + sim.distance)
+            carried = 0
+        elif "level" in events:
+            carried += goal
+    elapsed = time.perf_counter() - start
+    best = max(best, carried + sim.distance)  # el último intento sigue vivo
+    return {
+        "seed": sim.rng.seed,
+        "level": sim.current_level,
+        "crashes": crashes,
+        "passed": sim.obstacles.culled,
+        "best": int(best),
+        "plans": getattr(bot, "plans", 0),
+        "ticks_per_sec": ticks / elapsed if elapsed else 0,
+    }
+
+
+def main(argv=None):
+    from gd.presets import get_preset, preset_names
+
+    parser = argparse.ArgumentParser(description="Prueba de resistencia con un bot, sin pantalla")
+    parser.add_argument("--preset", nargs="+", default=[None], help="presets a jugar ('all' = todos)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="autopilot")
+    parser.add_argument("--ticks", type=int, default=100000)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    presets = preset_names() if "all" in args.preset else args.preset
+
+    status = 0
+    for name in presets:
+        result = soak(get_preset(name), args.bot, args.ticks, args.seed)
+        print(f"{name or 'por defecto'}: semilla {result['seed']}, nivel {result['level']}, "
+              f"{result['crashes']} choques, {result['passed']} obstáculos superados, "
+              f"mejor {result['best']}, {result['plans']} planes - {result['ticks_per_sec']:.0f} ticks/s")
+        status = status or (1 if result["crashes"] else 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
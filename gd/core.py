@@ -0,0 +1,646 @@
+"""Núcleo de simulación sin pantalla: física, obstáculos, colisiones y niveles.
+
+Nada en este módulo inicializa pygame ni abre una ventana; solo usa
+superficies SRCALPHA y `pygame.Rect`, que funcionan sin driver de video.
+"""
+import random
+from collections import deque
+from dataclasses import dataclass
+
+import pygame
+
+
+# ---------- CONFIG ----------
+ROTATION_MODES = ("none", "topleft", "center")
+
+# Reglas fijas de la partida, compartidas con gd.batch
+PLAYER_X = 120
+PLAYER_SIZE = 36
+CULL_X = -50  # los obstáculos cuyo borde derecho pasa de aquí se descartan
+FIRST_TRANSITION_TICKS = 90
+LEVEL_TRANSITION_TICKS = 120  # 2 segundos a 60 FPS
+RESTART_TICKS = 90  # 1.5 segundos
+
+
+@dataclass
+class Config:
+    """Constantes de una variante del juego (por defecto, las de geo5.6).
+
+    Las variantes con nombre están en `gd/presets.toml` (ver `gd.presets`).
+    """
+    width: int = 900
+    height: int = 400
+    tick_rate: int = 80  # ticks de física por segundo (independiente de los FPS)
+    gravity: float = 0.5
+    jump_velocity: float = -10
+    ground_height: int = 80
+    scroll_speed_base: float = 8
+    speed_per_level: float = 1.5
+    obstacle_freq: int = 2000  # ms entre obstáculos
+    level_distance: int = 10000
+    level_distance_growth: float = 1.0  # factor de LEVEL_DISTANCE en cada nivel nuevo
+    score_speed: float = 4  # 0 = el puntaje avanza a la velocidad del scroll
+    collision_frames: int = 15
+    spike_height: tuple = (40, 50)
+    spike_width: tuple = (40, 50)
+    block_height: tuple = (40, 60)
+    block_width: tuple = (40, 60)
+    pixel_collision: bool = True  # False: rectángulos sin rotar, como el juego original
+    rotation: str = "topleft"  # "none", "topleft" (se dibuja desde rect) o "center" (rect sigue a la imagen)
+    game_over: bool = False  # True: pantalla GAME OVER hasta pulsar Abajo; False: auto-reinicio
+    freeze_on_crash: bool = False  # True: tras chocar, el cubo queda quieto con su último cuadro (geo5.5)
+    transition_text: str = "¡Preparate!"
+    fair_spawns: bool = False  # solo genera obstáculos superables (ver gd.jumps)
+
+    @property
+    def ground_y(self):
+        return self.height - self.ground_height
+
+    @property
+    def tick_ms(self):
+        return 1000 / self.tick_rate
+
+    @property
+    def obstacle_ticks(self):
+        """`obstacle_freq` expresado en ticks de simulación."""
+        return self.obstacle_freq / self.tick_ms
+
+
+# ---------- ALEATORIEDAD ----------
+class RunRandom:
+    """Generadores aleatorios de una partida a partir de una semilla.
+
+    Hay un flujo independiente para los obstáculos y otro para el fondo, y
+    ambos se vuelven a sembrar al empezar cada nivel: la misma semilla da
+    siempre el mismo nivel, se dibuje o no el fondo y sin importar los
+    intentos anteriores.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.reseed(1)
+
+    def reseed(self, level):
+        self.obstacles = self.stream("obstacles", level)
+        self.background = self.stream("background", level)
+
+    def stream(self, name, level):
+        """Generador nuevo del flujo `name` para `level` (no toca los actuales)."""
+        # Las semillas de texto se derivan con SHA-512: estables entre ejecuciones
+        return random.Random(f"{self.seed}:{name}:{level}")
+
+
+# ---------- SPRITES DEL CUBO ----------
+def draw_cube(size, color):
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(image, color, (0,0,size,size), border_radius=6)
+    pygame.draw.polygon(image, (255,100,100),
+                        [(int(size*0.7), int(size*0.25)),
+                         (int(size*0.9), int(size*0.5)),
+                         (int(size*0.7), int(size*0.75))])
+    return image
+
+
+class RotationCache:
+    """Frames pre-rotados del cubo por (tamaño, color), indexados por ángulo.
+
+    Cada frame guarda la imagen y su máscara de colisión. La tabla de un
+    color se construye entera la primera vez que se pide, con un frame por
+    cada paso de `rotation_speed`.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.rotations = 0  # llamadas reales a transform.rotate
+
+    def table(self, size, color, step):
+        key = (size, tuple(color))
+        table = self.tables.get(key)
+        if table is None:
+            table = {"base": draw_cube(size, color)}
+            self.tables[key] = table
+            if step and 360 % step == 0:
+                for angle in range(0, 360, step):
+                    self._build(table, angle)
+        return table
+
+    def frame(self, table, angle):
+        frame = table.get(angle)
+        if frame is None:
+            frame = self._build(table, angle)
+        return frame
+
+    def _build(self, table, angle):
+        image = pygame.transform.rotate(table["base"], angle)
+        frame = (image, pygame.mask.from_surface(image))
+        table[angle] = frame
+        self.rotations += 1
+        return frame
+
+
+rotation_cache = RotationCache()
+
+
+# ---------- OBSTÁCULOS ----------
+_obstacle_shapes = {}
+
+
+def obstacle_shape(kind, width, height):
+    """Imagen y máscara de un obstáculo, compartidas por (tipo, ancho, alto)."""
+    key = (kind, width, height)
+    shape = _obstacle_shapes.get(key)
+    if shape is None:
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        if kind == "spike":
+            pygame.draw.polygon(image, (200,40,40),
+                                [(0,height),(width/2,0),(width,height)])
+        else:
+            pygame.draw.rect(image, (100,180,255), (0,0,width,height))
+        shape = (image, pygame.mask.from_surface(image))
+        _obstacle_shapes[key] = shape
+    return shape
+
+
+# ---------- CLASES ----------
+class Player(pygame.sprite.Sprite):
+    def __init__(self, x, y, config):
+        super().__init__()
+        self.config = config
+        self.size = PLAYER_SIZE
+        self.normal_color = (255,215,0)
+        self.collision_color = (255,50,50)
+        self.current_color = self.normal_color
+
+        # Rotación
+        self.rotation = config.rotation
+        if self.rotation == "none":
+            self.angle = 0
+            self.rotation_speed = 0
+        else:
+            self.angle = 90
+            self.rotation_speed = 3   # giro más fluido
+
+        # Imagen base y frames rotados (compartidos entre jugadores)
+        self.update_image()
+
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.rect.topleft = (x, y)
+        self.prev_y = self.rect.y  # posición del tick anterior, para interpolar
+
+        self.vel_y = 0
+        self.on_ground = False
+        self.alive = True
+        self.collision_timer = 0
+
+    def update_image(self):
+        """Actualiza el color del cubo."""
+        self.rotations = rotation_cache.table(self.size, self.current_color, self.rotation_speed)
+        self.base_image = self.rotations["base"]
+        self.set_angle_image()
+
+    def set_angle_image(self):
+        self.image, self.mask = rotation_cache.frame(self.rotations, self.angle)
+
+    def image_rect(self):
+        """Rectángulo de la imagen tal como se dibuja (la rotada puede ser mayor que `rect`)."""
+        return self.image.get_rect(topleft=self.rect.topleft)
+
+    def update(self):
+        # -------- FÍSICA --------
+        self.vel_y += self.config.gravity
+        self.rect.y += int(self.vel_y)
+
+        ground_y = self.config.ground_y
+
+        # Suelo estable reforzado
+        if self.rect.bottom >= ground_y:
+            self.rect.bottom = ground_y
+            self.vel_y = 0
+            self.on_ground = True
+        else:
+            self.on_ground = False
+
+        # -------- ROTACIÓN --------
+        if self.rotation != "none":
+            old_center = self.rect.center
+
+            if not self.on_ground:
+                self.angle = (self.angle + self.rotation_speed) % 360
+            else:
+                self.angle = 0  # alineado en el suelo
+
+            self.set_angle_image()
+            if self.rotation == "center":
+                self.rect.size = self.image.get_size()
+                self.rect.center = old_center
+
+        # -------- COLOR DAÑO --------
+        if self.collision_timer > 0:
+            self.collision_timer -= 1
+            if self.collision_timer == 0:
+                self.current_color = self.normal_color
+                self.update_image()
+
+    def jump(self):
+        if self.on_ground and self.alive:
+            self.vel_y = self.config.jump_velocity
+
+    def set_collision(self):
+        self.current_color = self.collision_color
+        self.update_image()
+        self.collision_timer = self.config.collision_frames
+
+    def draw(self, surface, alpha=1.0):
+        y = self.prev_y + (self.rect.y - self.prev_y) * alpha
+        return surface.blit(self.image, (self.rect.x, round(y)))
+
+
+class Obstacle(pygame.sprite.Sprite):
+    def __init__(self, x, ground_y, kind="spike", height=60, width=35):
+        super().__init__()
+        self.reset(x, ground_y, kind, height, width)
+
+    def reset(self, x, ground_y, kind="spike", height=60, width=35):
+        """Reconfigura el obstáculo; lo usa `ObstaclePool` para reciclarlo."""
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.image, self.mask = obstacle_shape(kind, width, height)
+        self.rect = self.image.get_rect()
+        self.rect.bottomleft = (x, ground_y)
+        self.prev_x = self.rect.x
+
+    def update(self, scroll_speed):
+        self.prev_x = self.rect.x
+        self.rect.x -= scroll_speed
+
+    def draw(self, surface, alpha=1.0):
+        x = self.prev_x + (self.rect.x - self.prev_x) * alpha
+        return surface.blit(self.image, (round(x), self.rect.y))
+
+
+class ObstaclePool:
+    """Reserva de obstáculos reutilizables.
+
+    Las imágenes ya se comparten por (tipo, ancho, alto); el pool evita además
+    crear y destruir un objeto por cada obstáculo, para que las partidas
+    largas no acumulen basura que dispare pausas del GC en pleno salto.
+    """
+
+    def __init__(self):
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x, ground_y, kind="spike", height=60, width=35):
+        if self.free:
+            ob = self.free.pop()
+            ob.reset(x, ground_y, kind, height, width)
+            self.reused += 1
+        else:
+            ob = Obstacle(x, ground_y, kind, height, width)
+            self.created += 1
+        return ob
+
+    def release(self, ob):
+        self.free.append(ob)
+
+
+class ObstacleTrack:
+    """Obstáculos en una deque ordenada por x (de izquierda a derecha).
+
+    Todos nacen en el borde derecho y avanzan a la misma velocidad, así que
+    el orden se mantiene solo: los que salen por la izquierda se sacan del
+    frente, y colisión y dibujo recorren solo la ventana que les interesa.
+    """
+
+    def __init__(self, pool=None, cull_x=CULL_X):
+        self.items = deque()
+        self.pool = pool or ObstaclePool()
+        self.cull_x = cull_x
+        self.culled = 0  # obstáculos que salieron por la izquierda (superados)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, ob):
+        self.items.append(ob)
+
+    def spawn(self, x, ground_y, kind="spike", height=60, width=35):
+        ob = self.pool.acquire(x, ground_y, kind, height, width)
+        self.items.append(ob)
+        return ob
+
+    def empty(self):
+        for ob in self.items:
+            self.pool.release(ob)
+        self.items.clear()
+
+    def update(self, scroll_speed):
+        items = self.items
+        for ob in items:
+            ob.update(scroll_speed)
+        while items and items[0].rect.right < self.cull_x:
+            self.pool.release(items.popleft())
+            self.culled += 1
+
+    def window(self, left, right):
+        """Obstáculos cuyo rango en x puede solapar [left, right)."""
+        for ob in self.items:
+            r = ob.rect
+            if r.left >= right:
+                break
+            if r.right > left:
+                yield ob
+
+
+# ---------- GENERACIÓN ----------
+FAIR_ATTEMPTS = 6  # candidatos al azar antes de recurrir al obstáculo mínimo
+
+
+def roll_obstacle(cfg, rng):
+    kind = rng.choice(["spike", "spike", "spike", "block"])
+    if kind == "spike":
+        h = rng.randint(*cfg.spike_height)
+        w = rng.randint(*cfg.spike_width)
+    else:
+        h = rng.randint(*cfg.block_height)
+        w = rng.randint(*cfg.block_width)
+    return kind, h, w
+
+
+def choose_obstacle(cfg, rng, spawner, tick, scroll_speed):
+    """(tipo, alto, ancho) del siguiente obstáculo, o None si hay que saltarse
+    este hueco. Sin `spawner` (gd.jumps.FairSpawner) es siempre la primera tirada."""
+    if spawner is None:
+        return roll_obstacle(cfg, rng)
+    for _ in range(FAIR_ATTEMPTS):
+        kind, h, w = roll_obstacle(cfg, rng)
+        if spawner.place(tick, scroll_speed, h, w):
+            return kind, h, w
+    # Ningún candidato cabe: el pincho más pequeño, o un hueco más largo
+    h, w = cfg.spike_height[0], cfg.spike_width[0]
+    if spawner.place(tick, scroll_speed, h, w):
+        return "spike", h, w
+    return None
+
+
+# ---------- SIMULACIÓN ----------
+class Simulation:
+    """Estado completo de una partida, avanzado tick a tick con `step()`.
+
+    Cada tick dura siempre `config.tick_ms`, así que los saltos y el puntaje
+    no dependen de los FPS de pantalla (ver `FixedTimestep`).
+    `step()` devuelve la lista de eventos ocurridos en el tick
+    ("crash", "record", "level", "reset") para que la capa de pantalla y la
+    de persistencia reaccionen sin leer el estado interno.
+
+    Con `config.game_over` el choque deja `show_game_over` activo hasta que
+    llega un `step(restart=True)`; si no, la partida se reinicia sola.
+    """
+
+    def __init__(self, config=None, highscore=0, seed=None, levels=None):
+        self.config = config or Config()
+        cfg = self.config
+        self.rng = RunRandom(seed)
+        self.player = Player(PLAYER_X, cfg.ground_y - PLAYER_SIZE, cfg)
+        self.obstacles = ObstacleTrack()
+        self.spawner = None
+        if cfg.fair_spawns:
+            from gd.jumps import FairSpawner  # gd.jumps importa este módulo
+            self.spawner = FairSpawner(cfg)
+        self.current_level = 1
+        self.level_distance = cfg.level_distance
+        self.distance = 0
+        self.highscore = highscore
+        self.best_distance = 0  # mejor distancia de esta partida
+        self.crash_distance = 0  # distancia del último choque
+        self.ticks = 0
+        self.last_obstacle_tick = 0
+        self.scroll_speed = cfg.scroll_speed_base
+        self.game_active = True
+        self.show_level_transition = True
+        self.transition_timer = FIRST_TRANSITION_TICKS
+        self.auto_restart_timer = 0
+        self.show_game_over = False
+        self.scrolled = False  # si los obstáculos avanzaron en el último tick
+        self.events = []
+        self.profiler = None  # gd.profiler.FrameProfiler para medir las fases del tick
+        # gd.levels.ChunkedLevels (generados por adelantado) o
+        # gd.levelfile.LevelStream (niveles hechos a mano)
+        self.levels = levels
+
+        # Inicializar primer nivel
+        self.reset_game(self.current_level)
+
+    def reset_game(self, level):
+        cfg = self.config
+        self.rng.reseed(level)
+
+        # Limpiar obstáculos
+        self.obstacles.empty()
+        if self.spawner is not None:
+            self.spawner.reset()
+
+        # Reiniciar jugador
+        player = self.player
+        player.rect.topleft = (PLAYER_X, cfg.ground_y - player.size)
+        player.prev_y = player.rect.y
+        player.vel_y = 0
+        player.alive = True
+        player.current_color = player.normal_color
+        player.update_image()
+        player.collision_timer = 0
+
+        # Velocidad según nivel
+        self.scroll_speed = cfg.scroll_speed_base + (level - 1) * cfg.speed_per_level
+        self.distance = 0
+        self.last_obstacle_tick = self.ticks
+        self.game_active = True
+        if self.levels is not None:
+            # Una fuente puede fijar el largo del nivel (los niveles hechos a mano)
+            level_distance = self.levels.start_level(self.rng, level, self.scroll_speed)
+            if level_distance:
+                self.level_distance = level_distance
+        self.events.append("reset")
+
+    def next_level(self):
+        self.current_level += 1
+        # Aumento de la distancia requerida para completar el nivel
+        self.level_distance = int(self.level_distance * self.config.level_distance_growth)
+        self.show_level_transition = True
+        self.transition_timer = LEVEL_TRANSITION_TICKS
+        self.events.append("level")
+        self.reset_game(self.current_level)
+
+    def spawn_obstacle(self):
+        cfg = self.config
+        if self.levels is not None:
+            choice = self.levels.next_obstacle()
+        else:
+            choice = choose_obstacle(cfg, self.rng.obstacles, self.spawner, self.ticks, self.scroll_speed)
+        if choice is None:
+            return None
+        kind, h, w = choice
+        return self.obstacles.spawn(cfg.width + 20, cfg.ground_y, kind=kind, height=h, width=w)
+
+    def find_collision(self):
+        """Devuelve el obstáculo que toca al jugador, o None.
+
+        Primero descarta por rectángulos (solo los obstáculos que coinciden en
+        x con el jugador) y solo entonces compara máscaras de píxeles, así las
+        esquinas vacías de los pinchos y del cubo rotado no matan.
+        """
+        player = self.player
+        if not self.config.pixel_collision:
+            prect = player.rect
+            for ob in self.obstacles.window(prect.left, prect.right):
+                if ob.rect.colliderect(prect):
+                    return ob
+            return None
+
+        prect = player.image_rect()
+        for ob in self.obstacles.window(prect.left, prect.right):
+            r = ob.rect
+            if not r.colliderect(prect):
+                continue
+            if player.mask.overlap(ob.mask, (r.x - prect.x, r.y - prect.y)):
+                return ob
+        return None
+
+    def step(self, jump=False, restart=False):
+        """Avanza un tick. `jump` y `restart` indican si hubo pulsación de salto
+        o de "continuar" (pantalla GAME OVER) desde el tick anterior."""
+        cfg = self.config
+        self.events = []
+        self.ticks += 1
+        player = self.player
+        prof = self.profiler
+        player.prev_y = player.rect.y
+        self.scrolled = False
+
+        if restart and self.show_game_over:
+            self.show_game_over = False
+            self.reset_game(self.current_level)
+
+        if jump and self.game_active:
+            player.jump()
+
+        # ---------- TRANSICIÓN DE NIVEL ----------
+        if self.show_level_transition:
+            self.transition_timer -= 1
+            if self.transition_timer <= 0:
+                self.show_level_transition = False
+        if prof:
+            prof.mark("transition")
+
+        # ---------- LÓGICA ----------
+        if self.game_active and not self.show_level_transition:
+            player.update()
+            if prof:
+                prof.mark("player")
+
+            self.scrolled = True
+            self.obstacles.update(self.scroll_speed)
+            if prof:
+                prof.mark("obstacles")
+
+            # Colisiones
+            if self.find_collision():
+                player.alive = False
+                if not cfg.freeze_on_crash:
+                    player.set_collision()
+                self.game_active = False
+                if cfg.game_over:
+                    self.show_game_over = True  # <<< GAME OVER
+                else:
+                    self.auto_restart_timer = RESTART_TICKS
+                self.events.append("crash")
+                self.crash_distance = int(self.distance)
+                self.best_distance = max(self.best_distance, self.crash_distance)
+                if int(self.distance) > self.highscore:
+                    self.highscore = int(self.distance)
+                    self.events.append("record")
+            if prof:
+                prof.mark("collision")
+
+            # Generar obstáculos (los niveles hechos a mano van por posición)
+            if self.levels is not None and self.levels.positional:
+                self.levels.stream(self)
+            elif self.ticks - self.last_obstacle_tick > cfg.obstacle_ticks:
+                self.last_obstacle_tick = self.ticks
+                self.spawn_obstacle()
+
+            # Actualizar distancia
+            score_speed = cfg.score_speed or self.scroll_speed
+            self.distance += score_speed * (cfg.tick_ms / 16.6667)
+
+            # Verificar si completó el nivel
+            if self.distance >= self.level_distance:
+                self.next_level()
+            if prof:
+                prof.mark("spawn")
+
+        # Auto-reinicio después de colisión
+        elif not self.game_active:
+            if not cfg.freeze_on_crash:
+                player.update()  # Para actualizar el timer de color
+            if not cfg.game_over:
+                self.auto_restart_timer -= 1
+                if self.auto_restart_timer <= 0:
+                    self.reset_game(self.current_level)
+            if prof:
+                prof.mark("player")
+
+        return self.events
+
+
+class FixedTimestep:
+    """Acumulador de tiempo real que avanza la simulación a paso fijo.
+
+    La pantalla puede ir a cualquier FPS (incluso sin límite): cada frame se
+    ejecutan los ticks que quepan en el tiempo transcurrido y `alpha` indica
+    cuánto falta para el siguiente, para interpolar las posiciones al dibujar.
+
+    `inputs` (un iterable de `(jump, restart)` por tick, p. ej.
+    `Replay.inputs()`) sustituye a la entrada en vivo; `recorder` recibe la
+    entrada de cada tick.
+    """
+
+    def __init__(self, sim, max_frame_ms=250, inputs=None, recorder=None):
+        self.sim = sim
+        self.max_frame_ms = max_frame_ms  # evita la "espiral de la muerte" tras un frame muy lento
+        self.accumulator = 0.0
+        self.pending_jump = False
+        self.pending_restart = False
+        self.inputs = iter(inputs) if inputs is not None else None
+        self.recorder = recorder
+
+    def advance(self, elapsed_ms, jump=False, restart=False):
+        """Ejecuta los ticks pendientes y devuelve los eventos de todos ellos."""
+        tick_ms = self.sim.config.tick_ms
+        self.pending_jump = self.pending_jump or jump
+        self.pending_restart = self.pending_restart or restart
+        self.accumulator += min(elapsed_ms, self.max_frame_ms)
+        events = []
+        while self.accumulator >= tick_ms:
+            if self.inputs is not None:
+                jump, restart = next(self.inputs, (False, False))
+            else:
+                jump, restart = self.pending_jump, self.pending_restart
+            if self.recorder is not None:
+                self.recorder.record(jump, restart)
+            events.extend(self.sim.step(jump, restart))
+            self.pending_jump = False
+            self.pending_restart = False
+            self.accumulator -= tick_ms
+        return events
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.sim.config.tick_ms
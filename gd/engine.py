@@ -0,0 +1,237 @@
+"""Bucle de juego común a todas las variantes.
+
+Cada `geo5.x.py` es ahora un lanzador que llama a `main(preset="5.x")`;
+la variante se elige con `--preset` y sus constantes salen de
+`gd/presets.toml`.
+
+    python -m gd.engine --preset 5.3 --seed 42
+"""
+import argparse
+import sys
+import time
+
+import pygame
+
+from gd.bot import AutopilotBot, bot_inputs
+from gd.core import FixedTimestep, Simulation
+from gd.levelfile import LevelFileError, LevelStream
+from gd.levels import ChunkedLevels
+from gd.presets import get_preset, preset_names
+from gd.profiler import FrameProfiler, counters, format_counters
+from gd.render import DirtyRenderer, Renderer
+from gd.replay import Replay, ReplayError, ReplayRecorder
+from gd.scores import DEFAULT_PROFILE, ScoreStore
+from gd.text import TextCache
+from gd.worker import IOWorker
+
+# ---------- CONFIG ----------
+FPS = 0  # FPS de pantalla por defecto; 0 = el tick_rate del preset
+FONT_NAME = None
+CAPTION = "Geometry Dash - Multi Nivel"
+STARTUP_TARGET_MS = 100  # de main() al primer frame en pantalla (sin contar `import pygame`)
+
+
+def parse_seed(text):
+    """La semilla se graba como entero sin signo de 64 bits."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"semilla no válida: {text}") from None
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f"semilla fuera de rango (0 a 2**64 - 1): {text}")
+    return seed
+
+
+def parse_args(preset, argv):
+    parser = argparse.ArgumentParser(description=CAPTION)
+    parser.add_argument("--preset", default=preset, choices=preset_names(),
+                        help="variante del juego (ver gd/presets.toml)")
+    parser.add_argument("--list-presets", action="store_true", help="muestra los presets y sale")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="FPS de pantalla; 0 = el tick_rate del preset, -1 = sin límite")
+    parser.add_argument("--dirty", action="store_true", help="solo redibuja lo que cambia (F3 lo alterna)")
+    parser.add_argument("--player", default=DEFAULT_PROFILE, help="perfil para la tabla de líderes")
+    parser.add_argument("--seed", type=parse_seed, help="semilla de la partida (por defecto, aleatoria)")
+    parser.add_argument("--record", metavar="ARCHIVO", help="graba la partida en ARCHIVO al salir")
+    parser.add_argument("--replay", metavar="ARCHIVO", help="reproduce una partida grabada")
+    parser.add_argument("--autopilot", action="store_true", help="juega el bot con anticipación (gd.bot)")
+    parser.add_argument("--profile", action="store_true", help="muestra el perfilador por fases (F1 lo alterna)")
+    parser.add_argument("--profile-out", metavar="ARCHIVO",
+                        help="al salir, vuelca la traza por frame a ARCHIVO (.csv o .json); implica --profile")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="genera los trozos de nivel en el bucle de juego, sin hilo productor")
+    parser.add_argument("--level", nargs="+", metavar="ARCHIVO",
+                        help="juega niveles hechos a mano (.gdl, ver gd.levelfile), uno por nivel")
+    parser.add_argument("--start-px", type=int, default=0,
+                        help="con --level, empieza cada intento en esta x del nivel (práctica)")
+    parser.add_argument("--frames", type=int, default=0, help="sale tras N frames (0 = sin límite)")
+    parser.add_argument("--startup-time", action="store_true",
+                        help=f"mide el tiempo hasta el primer frame (objetivo: {STARTUP_TARGET_MS} ms)")
+    args = parser.parse_args(argv)
+    if args.level and (args.record or args.replay):
+        # Las repeticiones solo guardan semilla y config, no el archivo de nivel
+        parser.error("--level no se puede combinar con --record ni --replay")
+    return args
+
+
+def main(preset=None, argv=None):
+    started = time.perf_counter()
+    args = parse_args(preset, argv)
+    if args.list_presets:
+        for name in preset_names():
+            print(name)
+        return 0
+
+    config = get_preset(args.preset)
+    seed = args.seed
+    if args.level:
+        try:
+            levels = LevelStream(config, args.level, args.start_px)
+        except (OSError, LevelFileError) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+    replay = None
+    if args.replay:
+        try:
+            replay = Replay.load(args.replay)
+        except (OSError, ReplayError) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+    if replay is not None:
+        # La repetición trae su propia semilla y configuración
+        config = replay.config
+        seed = replay.seed
+    fps = config.tick_rate if args.fps == 0 else max(args.fps, 0)
+
+    # ---------- INICIALIZAR PYGAME ----------
+    # Solo video y fuentes: pygame.init() arrancaría también audio y
+    # joysticks, que el juego no usa y que son lo más lento de iniciar.
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((config.width, config.height))
+    clock = pygame.time.Clock()
+    text_cache = TextCache(FONT_NAME)
+
+    # ---------- INICIALIZACIÓN ----------
+    # Toda la lógica vive en gd.core.Simulation; aquí solo se lee la
+    # entrada, se avanza la simulación y se dibuja.
+    # Toda escritura a disco pasa por el hilo de E/S, fuera del frame
+    io_worker = IOWorker()
+    scores = ScoreStore(args.player, args.preset, worker=io_worker)
+    # Los obstáculos se generan por trozos en otro hilo (mismo resultado),
+    # salvo con --level, que los lee del archivo a medida que entran
+    if not args.level:
+        levels = ChunkedLevels(config, background=not args.no_prefetch)
+    sim = Simulation(config, highscore=scores.load_highscore(), seed=seed, levels=levels)
+    recorder = ReplayRecorder(sim.rng.seed, config) if args.record else None
+    bot = None
+    if replay is not None:
+        inputs = replay.inputs()
+    elif args.autopilot:
+        bot = AutopilotBot(config)
+        inputs = bot_inputs(bot, sim)
+    else:
+        inputs = None
+    stepper = FixedTimestep(sim, inputs=inputs, recorder=recorder)
+
+    profiler = FrameProfiler(trace=bool(args.profile_out))
+    profiling = args.profile or bool(args.profile_out)
+
+    def make_renderer(dirty, previous=None):
+        cls = DirtyRenderer if dirty else Renderer
+        pygame.display.set_caption(CAPTION + (" [dirty]" if dirty else ""))
+        return cls(screen, config, text_cache, sim.rng, previous)
+
+    def attach_profiler(renderer):
+        # Sin perfilador, simulación y renderer no miden nada
+        sim.profiler = renderer.profiler = profiler if profiling else None
+
+    dirty_rects = args.dirty
+    renderer = make_renderer(dirty_rects)
+    attach_profiler(renderer)
+
+    # ---------- BUCLE PRINCIPAL ----------
+    # Lo que quede en la cola de E/S (récord, tabla, repetición) se escribe
+    # aunque el bucle termine con una excepción
+    try:
+        frames = 0
+        running = True
+        while running:
+            dt = clock.tick(fps)
+            if profiling:
+                profiler.begin_frame()
+
+            jump = restart = False
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE or event.key == pygame.K_UP:
+                        jump = True
+                    if event.key == pygame.K_DOWN:
+                        restart = True  # continuar desde la pantalla GAME OVER
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    if event.key == pygame.K_F3:
+                        dirty_rects = not dirty_rects
+                        renderer = make_renderer(dirty_rects, renderer)
+                        attach_profiler(renderer)
+                    if event.key == pygame.K_F1:
+                        profiling = not profiling
+                        attach_profiler(renderer)
+                        renderer.invalidate()  # quita o pone el panel en toda la pantalla
+                        if profiling:
+                            profiler.begin_frame()
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    jump = True
+            if profiling:
+                profiler.mark("events")
+
+            # ---------- LÓGICA ----------
+            events = stepper.advance(dt, jump, restart)
+            if replay is None:
+                if "crash" in events:
+                    scores.add_run(sim.current_level, sim.crash_distance)
+                if "record" in events:
+                    scores.save_highscore(sim.highscore)
+
+            # ---------- DIBUJO ----------
+            renderer.handle_events(events)
+            dirty = renderer.draw(sim, stepper.alpha, dt)
+
+            # ---------- ACTUALIZAR PANTALLA ----------
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            if profiling:
+                profiler.mark("flip")
+                profiler.end_frame()
+
+            frames += 1
+            if frames == 1 and args.startup_time:
+                startup_ms = (time.perf_counter() - started) * 1000
+                verdict = "OK" if startup_ms <= STARTUP_TARGET_MS else "por encima del objetivo"
+                print(f"arranque: {startup_ms:.1f} ms hasta el primer frame "
+                      f"(objetivo {STARTUP_TARGET_MS} ms: {verdict})")
+            if frames == args.frames:
+                running = False
+    finally:
+        # Salir
+        if recorder is not None:
+            io_worker.submit(recorder.finish(sim).save, args.record)
+        if args.profile_out:
+            io_worker.submit(profiler.dump, args.profile_out)
+        levels.close()
+        scores.close()
+        io_worker.close()  # vacía la cola antes de salir
+        io_worker.report()
+        if args.profile or args.profile_out:
+            print("contadores: " + format_counters(counters(sim, renderer, levels, bot)), file=sys.stderr)
+        pygame.quit()
+    # La grabación (o la traza) que no se pudo escribir es un error de salida
+    return 1 if io_worker.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
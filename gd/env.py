@@ -0,0 +1,279 @@
+"""Entornos estilo Gymnasium para entrenar agentes sin pantalla.
+
+`GameEnv` envuelve una `Simulation` (mismas reglas que el juego: física
+del jugador, generación, colisión y fin de nivel) con la API
+`reset() -> (obs, info)` / `step(acción) -> (obs, recompensa, terminado,
+truncado, info)`. La acción es 0 (nada) o 1 (saltar); el episodio termina
+al chocar. La observación es un vector compacto:
+
+    [y del jugador, vel_y, en el suelo, velocidad de scroll,
+     y por cada uno de los K obstáculos siguientes: dx, ancho, alto, es bloque]
+
+todo normalizado a rangos pequeños; con `obs_type="pixels"` es en cambio
+la pantalla dibujada fuera de pantalla y reducida a `pixel_size`.
+
+`VectorGameEnv` avanza N episodios a la vez sobre `gd.batch.BatchSimulation`
+con reinicio automático, para decenas de miles de pasos por segundo y núcleo.
+
+Los dos entornos juegan con las reglas que admite `BatchSimulation`:
+colisión por rectángulos, auto-reinicio y rotación "topleft" en lugar de
+"center". Así un agente entrenado en uno se evalúa con las mismas reglas
+en el otro.
+
+Si Gymnasium está instalado, las clases heredan de `gymnasium.Env` y
+declaran `action_space`/`observation_space`; si no, funcionan igual sin él.
+"""
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError("gd.env necesita NumPy (pip install numpy)") from exc
+
+try:
+    import gymnasium
+    from gymnasium import spaces
+except ImportError:
+    gymnasium = None
+    spaces = None
+
+from dataclasses import replace
+
+import pygame
+
+from gd.batch import BatchSimulation
+from gd.core import PLAYER_SIZE, PLAYER_X, RunRandom, Simulation
+from gd.presets import get_preset
+from gd.render import Renderer
+from gd.text import TextCache
+
+PLAYER_FEATURES = 4
+OBSTACLE_FEATURES = 4
+
+# Recompensas: sobrevivir, completar nivel, chocar
+REWARD_TICK = 0.01
+REWARD_LEVEL = 1.0
+REWARD_CRASH = -1.0
+
+_Base = gymnasium.Env if gymnasium is not None else object
+
+
+def _config(config, preset):
+    config = config if config is not None else get_preset(preset)
+    return replace(config, pixel_collision=False, game_over=False, freeze_on_crash=False,
+                   rotation="topleft" if config.rotation == "center" else config.rotation)
+
+
+def _spaces(obs_shape, dtype, low, high):
+    if spaces is None:
+        return None, None
+    return spaces.Discrete(2), spaces.Box(low, high, obs_shape, dtype)
+
+
+class GameEnv(_Base):
+    metadata = {"render_modes": ["rgb_array"]}
+
+    def __init__(self, config=None, preset=None, k=3, obs_type="vector",
+                 pixel_size=(112, 50), render_mode=None, max_ticks=None,
+                 skip_transitions=True):
+        if obs_type not in ("vector", "pixels"):
+            raise ValueError("obs_type debe ser 'vector' o 'pixels'")
+        self.config = _config(config, preset)
+        self.k = k
+        self.obs_type = obs_type
+        self.pixel_size = pixel_size
+        self.render_mode = render_mode
+        self.max_ticks = max_ticks
+        self.skip_transitions = skip_transitions
+        self.sim = None
+        self.surface = None  # lienzo fuera de pantalla (solo con píxeles o render)
+        self.renderer = None
+        self.seeds = np.random.default_rng()
+        if obs_type == "vector":
+            shape = (PLAYER_FEATURES + OBSTACLE_FEATURES * k,)
+            self.action_space, self.observation_space = _spaces(shape, np.float32, -np.inf, np.inf)
+        else:
+            shape = (pixel_size[1], pixel_size[0], 3)
+            self.action_space, self.observation_space = _spaces(shape, np.uint8, 0, 255)
+
+    # ---------- API ----------
+    def reset(self, seed=None, options=None):
+        if seed is not None:
+            self.seeds = np.random.default_rng(seed)
+        self.sim = Simulation(self.config, seed=int(self.seeds.integers(2**32)))
+        self._skip_transition()
+        if self.renderer is not None:
+            self.renderer.rng = self.sim.rng
+            self.renderer.reset_background()
+        return self._observation(), {"seed": self.sim.rng.seed}
+
+    def step(self, action):
+        sim = self.sim
+        events = sim.step(bool(action))
+        reward = REWARD_TICK
+        if "level" in events:
+            reward += REWARD_LEVEL
+            self._skip_transition()
+        terminated = "crash" in events
+        if terminated:
+            reward = REWARD_CRASH
+        truncated = self.max_ticks is not None and sim.ticks >= self.max_ticks
+        info = {"level": sim.current_level, "distance": sim.distance}
+        return self._observation(), reward, terminated, truncated, info
+
+    def render(self):
+        if self.render_mode != "rgb_array":
+            return None
+        self._draw(hud=True)
+        return np.transpose(pygame.surfarray.array3d(self.surface), (1, 0, 2))
+
+    def close(self):
+        self.surface = self.renderer = None
+
+    # ---------- INTERNOS ----------
+    def _skip_transition(self):
+        # La capa "NIVEL N" no cambia nada de la partida: no gastar pasos en ella
+        sim = self.sim
+        while self.skip_transitions and sim.show_level_transition:
+            sim.step()
+
+    def _observation(self):
+        if self.obs_type == "pixels":
+            self._draw(hud=False)
+            small = pygame.transform.smoothscale(self.surface, self.pixel_size)
+            return np.transpose(pygame.surfarray.array3d(small), (1, 0, 2))
+        return self._vector()
+
+    def _vector(self):
+        sim = self.sim
+        cfg = self.config
+        player = sim.player
+        obs = np.zeros(PLAYER_FEATURES + OBSTACLE_FEATURES * self.k, dtype=np.float32)
+        obs[0] = (cfg.ground_y - player.rect.bottom) / cfg.height
+        obs[1] = player.vel_y / abs(cfg.jump_velocity)
+        obs[2] = player.on_ground
+        obs[3] = sim.scroll_speed / cfg.scroll_speed_base
+        # Sin obstáculo: lejos (dx = 1) y sin tamaño
+        obs[PLAYER_FEATURES::OBSTACLE_FEATURES] = 1.0
+        i = PLAYER_FEATURES
+        for ob in sim.obstacles.window(player.rect.left, cfg.width + 100):
+            if i >= len(obs):
+                break
+            r = ob.rect
+            obs[i:i + OBSTACLE_FEATURES] = ((r.left - player.rect.right) / cfg.width,
+                                            r.width / PLAYER_SIZE, r.height / PLAYER_SIZE,
+                                            ob.kind == "block")
+            i += OBSTACLE_FEATURES
+        return obs
+
+    def _draw(self, hud):
+        cfg = self.config
+        if self.surface is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.surface = pygame.Surface((cfg.width, cfg.height))
+            self.renderer = Renderer(self.surface, cfg, TextCache(), self.sim.rng)
+        if hud:
+            self.renderer.draw(self.sim)
+        else:
+            self.renderer.draw_background(self.sim)
+            self.renderer.draw_sprites(self.sim)
+
+
+class VectorGameEnv:
+    """N episodios en paralelo sobre `BatchSimulation`, con reinicio automático.
+
+    `step(acciones)` devuelve arrays de N; si un episodio termina, la
+    observación devuelta ya es la del episodio nuevo y la final queda en
+    `info["final_observation"]` (como los entornos vectoriales de Gymnasium).
+    Solo observaciones vectoriales: para píxeles, usar varios `GameEnv`.
+    """
+
+    def __init__(self, num_envs, config=None, preset=None, k=3, max_ticks=None):
+        self.config = _config(config, preset)
+        self.num_envs = num_envs
+        self.k = k
+        self.max_ticks = max_ticks
+        self.seeds = np.random.default_rng()
+        self.batch = None
+        self.episode_ticks = np.zeros(num_envs, dtype=np.int64)
+        shape = (PLAYER_FEATURES + OBSTACLE_FEATURES * k,)
+        self.single_action_space, self.single_observation_space = _spaces(shape, np.float32, -np.inf, np.inf)
+
+    def reset(self, seed=None, options=None):
+        if seed is not None:
+            self.seeds = np.random.default_rng(seed)
+        seeds = [int(s) for s in self.seeds.integers(2**32, size=self.num_envs)]
+        self.batch = BatchSimulation(self.config, seeds)
+        self.episode_ticks[:] = 0
+        self._skip_transitions()
+        return self._observation(), {"seed": np.array(seeds)}
+
+    def step(self, actions):
+        b = self.batch
+        crashes = b.crashes.copy()
+        level = b.level.copy()
+        b.step(np.asarray(actions, dtype=bool))
+        self.episode_ticks += 1
+
+        # Por el contador: un choque en el tick que completa el nivel ya
+        # vuelve a dejar `alive` en True
+        terminated = b.crashes > crashes
+        leveled = b.level > level
+        reward = np.where(terminated, REWARD_CRASH, REWARD_TICK + leveled * REWARD_LEVEL).astype(np.float32)
+        if self.max_ticks is not None:
+            truncated = ~terminated & (self.episode_ticks >= self.max_ticks)
+        else:
+            truncated = np.zeros(self.num_envs, dtype=bool)
+        self._skip_transitions()
+
+        info = {"level": b.level.copy()}
+        done = np.flatnonzero(terminated | truncated)
+        if len(done):
+            info["final_observation"] = self._observation()[done]
+            info["_final_observation"] = terminated | truncated
+            self._restart(done)
+        return self._observation(), reward, terminated, truncated, info
+
+    def close(self):
+        self.batch = None
+
+    # ---------- INTERNOS ----------
+    def _restart(self, idx):
+        b = self.batch
+        for i, seed in zip(idx, self.seeds.integers(2**32, size=len(idx))):
+            b.rngs[i] = RunRandom(int(seed))
+        b.level[idx] = 1
+        b.level_distance[idx] = self.config.level_distance
+        b.auto_restart_timer[idx] = 0
+        b.reset(idx)
+        self.episode_ticks[idx] = 0
+
+    def _skip_transitions(self):
+        b = self.batch
+        b.show_level_transition[:] = False
+        b.transition_timer[:] = 0
+
+    def _observation(self):
+        b = self.batch
+        cfg = self.config
+        n, k = self.num_envs, self.k
+        obs = np.zeros((n, PLAYER_FEATURES + OBSTACLE_FEATURES * k), dtype=np.float32)
+        obs[:, 0] = (b.ground_y - (b.y + PLAYER_SIZE)) / cfg.height
+        obs[:, 1] = b.vel_y / abs(cfg.jump_velocity)
+        obs[:, 2] = b.on_ground
+        obs[:, 3] = b.scroll_speed / cfg.scroll_speed_base
+
+        # Los K obstáculos más cercanos que aún no pasaron al jugador
+        ahead = b.ob_active & (b.ob_x + b.ob_w > PLAYER_X)
+        key = np.where(ahead, b.ob_x, np.iinfo(np.int64).max)
+        kk = min(k, key.shape[1])
+        order = np.argsort(key, axis=1)[:, :kk]
+        rows = np.arange(n)[:, None]
+        valid = ahead[rows, order]
+        dx = np.where(valid, (b.ob_x[rows, order] - (PLAYER_X + PLAYER_SIZE)) / cfg.width, 1.0)
+        feats = np.stack([dx,
+                          np.where(valid, b.ob_w[rows, order] / PLAYER_SIZE, 0.0),
+                          np.where(valid, b.ob_h[rows, order] / PLAYER_SIZE, 0.0),
+                          np.where(valid, b.ob_kind[rows, order], 0)], axis=2)
+        obs[:, PLAYER_FEATURES:PLAYER_FEATURES + OBSTACLE_FEATURES * kk] = feats.reshape(n, -1)
+        obs[:, PLAYER_FEATURES + OBSTACLE_FEATURES * kk::OBSTACLE_FEATURES] = 1.0
+        return obs
@@ -0,0 +1,139 @@
+"""Tabla del arco de salto y generador de obstáculos siempre superables.
+
+`JumpTable` simula una vez, con el `Player` real, el salto completo de una
+variante (GRAVITY, JUMP_VELOCITY, tamaño y rotación del cubo) y guarda,
+para cada altura de obstáculo, el tramo de ticks del salto en que el cubo
+va por encima. Con eso, saber si un obstáculo se puede pasar a una
+velocidad de scroll dada son unas pocas cuentas enteras.
+
+`FairSpawner` encadena esos tramos: recuerda el salto más temprano con el
+que se superan todos los obstáculos ya generados y solo acepta un
+candidato si existe un salto posterior (con el cubo ya en el suelo) que
+lo supere. Así toda secuencia generada tiene al menos una solución.
+La comprobación usa rectángulos (la imagen rotada completa), que es más
+estricta que la colisión por máscara.
+"""
+import math
+
+from gd.core import PLAYER_SIZE, PLAYER_X, Player
+
+_tables = {}
+
+
+class JumpTable:
+    def __init__(self, config, samples=4):
+        self.config = config
+        ground_y = config.ground_y
+        player = Player(PLAYER_X, ground_y - PLAYER_SIZE, config)
+        player.update()  # asentado en el suelo, como al empezar
+        left, right = self._extent(player)
+
+        # Varios saltos seguidos, tras esperas distintas en el suelo: con
+        # rotación "center" el cubo rebota al aterrizar, así que ni los arcos
+        # ni los ticks en que se puede volver a saltar son siempre iguales.
+        arcs = []
+        gap = 1  # máximo de ticks entre dos momentos en que se puede saltar
+        for wait in range(samples):
+            clearance = [0]  # altura libre bajo el cubo en cada tick del salto (1..T-1)
+            player.jump()
+            while True:
+                player.update()
+                l, r = self._extent(player)
+                left, right = min(left, l), max(right, r)
+                if player.on_ground:
+                    break
+                bottom = max(player.rect.bottom, player.image_rect().bottom)
+                clearance.append(ground_y - bottom)
+            arcs.append(clearance)
+
+            # Quieto en el suelo un rato: cada cuánto se puede saltar
+            since = 0
+            for i in range(2 * len(clearance)):
+                player.update()
+                l, r = self._extent(player)
+                left, right = min(left, l), max(right, r)
+                since = 0 if player.on_ground else since + 1
+                gap = max(gap, since + 1)
+                if player.on_ground and i >= len(clearance) + wait:
+                    break
+
+        # Peor caso de todos los arcos: menor altura y aterrizaje más tardío
+        self.air_ticks = max(len(arc) for arc in arcs)  # ticks hasta volver a estar en el suelo
+        self.clearance = [min(arc[k] if k < len(arc) else 0 for arc in arcs)
+                          for k in range(self.air_ticks)]
+        self.jump_gap = gap
+        self.left, self.right = left, right  # extensión horizontal del cubo
+        self.top = max(self.clearance)
+
+        # Tramo [primer, último] de ticks con el cubo por encima de cada altura
+        self.windows = [None] * (self.top + 1)
+        for h in range(self.top + 1):
+            ticks = [k for k, c in enumerate(self.clearance) if k > 0 and c >= h]
+            if ticks:
+                self.windows[h] = (ticks[0], ticks[-1])
+
+    @staticmethod
+    def _extent(player):
+        irect = player.image_rect()
+        return min(player.rect.left, irect.left), max(player.rect.right, irect.right)
+
+    def window(self, height):
+        """(primer, último) tick del salto que pasan sobre `height`, o None."""
+        return self.windows[height] if 0 <= height <= self.top else None
+
+    @staticmethod
+    def step(scroll_speed):
+        """Píxeles que avanza de verdad un obstáculo por tick en x > 0
+        (`Rect` redondea cada paso con las mitades hacia arriba)."""
+        return math.ceil(scroll_speed - 0.5)
+
+
+def jump_table(config):
+    """`JumpTable` compartida por todas las partidas con la misma física."""
+    key = (config.gravity, config.jump_velocity, config.ground_height, config.rotation)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = JumpTable(config)
+    return table
+
+
+class FairSpawner:
+    def __init__(self, config):
+        self.config = config
+        self.table = jump_table(config)
+        self.spawn_x = config.width + 20
+        self.last_jump = None  # salto más temprano que supera lo ya generado
+        self.rejected = 0
+
+    def reset(self):
+        self.last_jump = None
+
+    def place(self, tick, scroll_speed, height, width):
+        """Acepta (y recuerda) el obstáculo si sigue habiendo solución. O(1)."""
+        table = self.table
+        window = table.window(height)
+        if window is None:
+            self.rejected += 1
+            return False
+        first, last = window
+
+        # Ticks en que el obstáculo (nacido en `tick`) solapa en x con el cubo
+        v = table.step(scroll_speed)
+        overlap_from = tick + (self.spawn_x - table.right) // v + 1
+        overlap_to = tick + -(-(self.spawn_x + width - table.left) // v) - 1
+
+        # Saltos J que dejan todo el solape dentro del tramo: J + first - 1 <= desde
+        # y hasta <= J + last - 1; además el cubo debe haber aterrizado del anterior
+        earliest = overlap_to + 1 - last
+        latest = overlap_from + 1 - first
+        earliest = max(earliest, tick + 1)
+        if self.last_jump is not None:
+            earliest = max(earliest, self.last_jump + table.air_ticks)
+        # Si el cubo no puede saltar en cualquier tick, el salto real puede
+        # llegar hasta jump_gap - 1 ticks tarde
+        last_jump = earliest + table.jump_gap - 1
+        if last_jump > latest:
+            self.rejected += 1
+            return False
+        self.last_jump = last_jump
+        return True
@@ -0,0 +1,346 @@
+"""Niveles hechos a mano en un formato binario compacto, leídos con mmap.
+
+Un archivo de nivel (.gdl) tiene tres partes:
+
+    cabecera   magic, versión, ancho de trozo, obstáculos, largo, distancia, trozos
+    índice     por cada trozo de `chunk_px` píxeles, el primer registro con x >= inicio
+    registros  obstáculos de tamaño fijo (x, ancho, alto, tipo), ordenados por x
+
+La x de un obstáculo se mide en píxeles de scroll desde el inicio del
+nivel: el obstáculo con x = 0 aparece en el borde derecho en el primer
+tick de juego. La cámara avanza lo que avanzan de verdad los obstáculos
+(el paso redondeado de `JumpTable.step`), así que las distancias escritas
+en el archivo son las que se ven en pantalla. `LevelStream` proyecta el archivo en memoria y solo
+convierte en `Obstacle` los registros que van entrando por la derecha,
+así que un nivel de millones de obstáculos abre al instante y ocupa lo
+mismo que uno corto. El índice sirve para empezar a mitad de nivel
+(`start_px`) sin recorrer el archivo. Con distancia 0, el nivel termina
+cuando su final (`largo`) llega al jugador.
+
+    python -m gd.levelfile build nivel.txt nivel.gdl   # líneas "x tipo alto ancho"
+    python -m gd.levelfile generate nivel.gdl --preset 5.6 --seed 7 --length 200000
+    python -m gd.levelfile info nivel.gdl
+    python -m gd.levelfile check nivel.gdl --preset 5.6
+    python -m gd.engine --level nivel.gdl
+"""
+import argparse
+import math
+import mmap
+import struct
+import sys
+
+from gd.core import PLAYER_X
+from gd.jumps import FairSpawner, JumpTable
+from gd.worker import atomic_write
+
+MAGIC = b"GDLV"
+VERSION = 1
+CHUNK_PX = 4096
+KINDS = ("spike", "block")  # código del tipo en el registro
+# magic, versión, reservado, ancho de trozo, obstáculos, largo, distancia, trozos
+_HEADER = struct.Struct("<4sBBHIIII")
+# x, ancho, alto, tipo
+_RECORD = struct.Struct("<IHBB")
+_INDEX = struct.Struct("<I")
+
+
+class LevelFileError(Exception):
+    pass
+
+
+# ---------- ESCRITURA ----------
+def pack_level(obstacles, length=None, distance=0, chunk_px=CHUNK_PX):
+    """Serializa obstáculos (x, tipo, alto, ancho) en el formato .gdl."""
+    if not 0 < chunk_px <= 0xFFFF:
+        raise LevelFileError(f"ancho de trozo fuera de rango: {chunk_px}")
+    records = sorted(obstacles, key=lambda ob: ob[0])
+    for x, kind, height, width in records:
+        if kind not in KINDS:
+            raise LevelFileError(f"tipo de obstáculo desconocido: {kind!r}")
+        if not (0 <= x <= 0xFFFFFFFF and 0 < width <= 0xFFFF and 0 < height <= 0xFF):
+            raise LevelFileError(f"obstáculo fuera de rango: x={x} alto={height} ancho={width}")
+    end = records[-1][0] + records[-1][3] if records else 0
+    length = end if length is None else max(length, end)
+    chunks = length // chunk_px + 1
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, 0, chunk_px, len(records), length, distance, chunks))
+    # Índice: primer registro de cada trozo (o el total si el trozo está vacío)
+    i = 0
+    for chunk in range(chunks):
+        start = chunk * chunk_px
+        while i < len(records) and records[i][0] < start:
+            i += 1
+        out += _INDEX.pack(i)
+    for x, kind, height, width in records:
+        out += _RECORD.pack(x, width, height, KINDS.index(kind))
+    return bytes(out)
+
+
+def write_level(path, obstacles, length=None, distance=0, chunk_px=CHUNK_PX):
+    atomic_write(path, pack_level(obstacles, length, distance, chunk_px))
+
+
+def parse_text(lines):
+    """Formato de texto para escribir niveles a mano: "x tipo alto ancho" por
+    línea; `#` empieza un comentario y `distance N` fija la distancia del nivel."""
+    obstacles = []
+    distance = 0
+    for number, line in enumerate(lines, 1):
+        parts = line.split("#", 1)[0].split()
+        if not parts:
+            continue
+        try:
+            if parts[0] == "distance" and len(parts) == 2:
+                distance = int(parts[1])
+            elif len(parts) == 4:
+                obstacles.append((int(parts[0]), parts[1], int(parts[2]), int(parts[3])))
+            else:
+                raise ValueError
+        except ValueError:
+            raise LevelFileError(f"línea {number}: se esperaba 'x tipo alto ancho'") from None
+    return obstacles, distance
+
+
+# ---------- LECTURA ----------
+class LevelFile:
+    """Un archivo .gdl proyectado en memoria; los registros se leen bajo demanda."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            self.file.close()
+            raise LevelFileError(f"{path}: archivo de nivel vacío") from None
+        try:
+            self._parse_header()
+        except LevelFileError:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        data = self.map
+        if len(data) < _HEADER.size:
+            raise LevelFileError(f"{self.path}: archivo de nivel demasiado corto")
+        magic, version, _, chunk_px, count, length, distance, chunks = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise LevelFileError(f"{self.path}: no es un archivo de nivel")
+        if version != VERSION:
+            raise LevelFileError(f"{self.path}: versión de nivel no soportada: {version}")
+        if not chunk_px or not chunks:
+            raise LevelFileError(f"{self.path}: índice de trozos vacío")
+        self.chunk_px = chunk_px
+        self.count = count
+        self.length = length
+        self.distance = distance
+        self.chunks = chunks
+        self.index_at = _HEADER.size
+        self.records_at = self.index_at + chunks * _INDEX.size
+        if len(data) < self.records_at + count * _RECORD.size:
+            raise LevelFileError(f"{self.path}: archivo de nivel truncado")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def record(self, i):
+        """(x, tipo, alto, ancho) del registro `i`."""
+        x, width, height, kind = _RECORD.unpack_from(self.map, self.records_at + i * _RECORD.size)
+        return x, KINDS[kind], height, width
+
+    def seek(self, x):
+        """Índice del primer registro con x >= `x`: salto por el índice y
+        búsqueda lineal dentro de un solo trozo."""
+        chunk = min(max(x, 0) // self.chunk_px, self.chunks - 1)
+        i = _INDEX.unpack_from(self.map, self.index_at + chunk * _INDEX.size)[0]
+        while i < self.count and self.record(i)[0] < x:
+            i += 1
+        return i
+
+
+class LevelStream:
+    """Fuente de obstáculos por posición para `Simulation(levels=...)`.
+
+    El nivel N juega `paths[(N - 1) % len(paths)]`. En vez de pedir un
+    obstáculo por hueco de tiempo (como `gd.levels.ChunkedLevels`), cada
+    tick avanza la cámara y crea los obstáculos cuya x ya entró en pantalla.
+    Del archivo solo se guarda un cursor y el próximo registro: memoria
+    constante, sea cual sea el largo del nivel.
+    """
+
+    positional = True
+
+    def __init__(self, config, paths, start_px=0):
+        if not paths:
+            raise ValueError("LevelStream necesita al menos un archivo de nivel")
+        self.config = config
+        self.paths = list(paths)
+        self.start_px = start_px
+        self.files = {}
+        for path in self.paths:  # abrir ya: un archivo roto falla antes de jugar
+            if path not in self.files:
+                self.files[path] = LevelFile(path)
+        self.current = None
+        self.camera = 0  # píxeles de scroll desde el inicio del nivel
+        self.cursor = 0
+        self.pending = None  # próximo registro aún fuera de pantalla
+
+    def _file(self, level):
+        return self.files[self.paths[(level - 1) % len(self.paths)]]
+
+    def start_level(self, rng, level, scroll_speed):
+        """Lo llama `Simulation.reset_game`: cada intento vuelve a `start_px`.
+        Devuelve la distancia del nivel, que la simulación toma al empezarlo."""
+        self.current = self._file(level)
+        self.camera = self.start_px
+        self.cursor = self.current.seek(self.start_px)
+        self.pending = self._read()
+        return self.level_distance(level, scroll_speed)
+
+    def level_distance(self, level, scroll_speed):
+        """La `distance` del archivo; si es 0, la que se recorre hasta que el
+        final del nivel (`length`) llega al jugador; sin `length`, la de la
+        configuración escalada por nivel como en `Simulation.next_level`."""
+        cfg = self.config
+        level_file = self.current
+        if level_file.distance:
+            return level_file.distance
+        if level_file.length:
+            # La cámara avanza `step` px por tick y x entra en pantalla en spawn_x
+            travel = level_file.length - self.start_px + cfg.width + 20 - PLAYER_X
+            ticks = max(1, math.ceil(travel / JumpTable.step(scroll_speed)))
+            score_speed = cfg.score_speed or scroll_speed
+            per_tick = score_speed * (cfg.tick_ms / 16.6667)
+            # Justo por encima de lo sumado en ticks - 1 (la suma de floats se desvía)
+            return math.floor((ticks - 1) * per_tick + 1e-6) + 1
+        distance = cfg.level_distance
+        for _ in range(level - 1):
+            distance = int(distance * cfg.level_distance_growth)
+        return distance
+
+    def _read(self):
+        level = self.current
+        if self.cursor >= level.count:
+            return None
+        ob = level.record(self.cursor)
+        self.cursor += 1
+        return ob
+
+    def stream(self, sim):
+        """Crea en el borde derecho los obstáculos que alcanzó la cámara."""
+        spawn_x = self.config.width + 20
+        ground_y = self.config.ground_y
+        camera = self.camera
+        ob = self.pending
+        while ob is not None and ob[0] <= camera:
+            x, kind, height, width = ob
+            sim.obstacles.spawn(spawn_x + x - camera, ground_y, kind=kind, height=height, width=width)
+            ob = self._read()
+        self.pending = ob
+        # Lo mismo que se movieron los obstáculos (Rect redondea cada paso)
+        self.camera = camera + JumpTable.step(sim.scroll_speed)
+
+    def close(self):
+        for level in self.files.values():
+            level.close()
+        self.files.clear()
+
+
+# ---------- HERRAMIENTAS ----------
+def generate(config, seed, length, level=1):
+    """Obstáculos al azar del generador normal, puestos por x: punto de
+    partida para editar un nivel a mano, o un nivel enorme de prueba."""
+    import math
+
+    from gd.core import RunRandom
+    from gd.levels import LevelLayout
+
+    speed = config.scroll_speed_base + (level - 1) * config.speed_per_level
+    layout = LevelLayout(config, RunRandom(seed), level, speed, chunk_slots=256)
+    step = (math.floor(config.obstacle_ticks) + 1) * JumpTable.step(speed)
+    n = 0
+    while n * step < length:
+        choice, _ = layout.slot(n)
+        if choice is not None:
+            kind, height, width = choice
+            yield n * step, kind, height, width
+        n += 1
+
+
+def check(config, level):
+    """Registros que `FairSpawner` no aceptaría con la velocidad del nivel 1."""
+    spawner = FairSpawner(config)
+    speed = config.scroll_speed_base
+    step = JumpTable.step(speed)
+    for i in range(level.count):
+        x, kind, height, width = level.record(i)
+        if not spawner.place(x // step, speed, height, width):
+            yield i, (x, kind, height, width)
+
+
+def main(argv=None):
+    from gd.presets import get_preset, preset_names
+
+    parser = argparse.ArgumentParser(description="Archivos de nivel .gdl")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="convierte un nivel de texto a .gdl")
+    build.add_argument("source")
+    build.add_argument("out")
+    build.add_argument("--chunk-px", type=int, default=CHUNK_PX)
+    gen = commands.add_parser("generate", help="escribe un nivel al azar como .gdl")
+    gen.add_argument("out")
+    gen.add_argument("--preset", choices=preset_names())
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("--length", type=int, default=100000, help="largo en píxeles de scroll")
+    gen.add_argument("--distance", type=int, default=0, help="distancia del nivel (0 = hasta el final del nivel)")
+    gen.add_argument("--chunk-px", type=int, default=CHUNK_PX)
+    info = commands.add_parser("info", help="muestra la cabecera de un .gdl")
+    info.add_argument("path")
+    chk = commands.add_parser("check", help="lista obstáculos imposibles de saltar")
+    chk.add_argument("path")
+    chk.add_argument("--preset", choices=preset_names())
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "build":
+            with open(args.source, encoding="utf-8") as f:
+                obstacles, distance = parse_text(f)
+            write_level(args.out, obstacles, distance=distance, chunk_px=args.chunk_px)
+            print(f"{args.out}: {len(obstacles)} obstáculos")
+        elif args.command == "generate":
+            obstacles = list(generate(get_preset(args.preset), args.seed, args.length))
+            write_level(args.out, obstacles, args.length, args.distance, args.chunk_px)
+            print(f"{args.out}: {len(obstacles)} obstáculos en {args.length} px")
+        elif args.command == "info":
+            with LevelFile(args.path) as level:
+                print(f"{args.path}: {level.count} obstáculos, {level.length} px, "
+                      f"distancia {level.distance or 'hasta el final'}, "
+                      f"{level.chunks} trozos de {level.chunk_px} px")
+        else:
+            bad = 0
+            with LevelFile(args.path) as level:
+                for i, ob in check(get_preset(args.preset), level):
+                    bad += 1
+                    print(f"registro {i}: x={ob[0]} {ob[1]} alto={ob[2]} ancho={ob[3]}")
+            print(f"{args.path}: {bad} obstáculos imposibles")
+            return 1 if bad else 0
+    except (OSError, LevelFileError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Generación de niveles por trozos, adelantada en un hilo productor.
+
+La secuencia de obstáculos de un nivel solo depende de la semilla, el
+nivel, la config y la velocidad de scroll: cada hueco de generación llega
+`floor(obstacle_ticks) + 1` ticks después del anterior y `FairSpawner`
+solo mira diferencias de ticks. Así que se puede generar antes de tiempo,
+en trozos de varias pantallas, y da exactamente los mismos obstáculos que
+la generación tick a tick (las repeticiones siguen valiendo).
+
+El hilo productor mantiene generados `ahead_px` píxeles por delante del
+jugador (y el primer trozo del nivel siguiente). Los trozos terminados se
+publican con `list.append`, atómico en CPython, así que el bucle de juego
+los lee sin cerrojos; solo si el productor se retrasa, el propio bucle
+genera el trozo que falta (y lo cuenta en `misses`).
+"""
+import math
+import threading
+
+from gd.core import choose_obstacle
+
+
+class LevelLayout:
+    """Obstáculos de un nivel (con una velocidad de scroll), en trozos."""
+
+    def __init__(self, config, rng, level, scroll_speed, chunk_slots):
+        self.config = config
+        self.level = level
+        self.scroll_speed = scroll_speed
+        self.chunk_slots = chunk_slots
+        self.period = math.floor(config.obstacle_ticks) + 1  # ticks entre huecos
+        self.seed = rng.seed
+        self.rng = rng.stream("obstacles", level)  # el mismo flujo que Simulation
+        self.spawner = None
+        if config.fair_spawns:
+            from gd.jumps import FairSpawner
+            self.spawner = FairSpawner(config)
+        self.chunks = []  # trozos publicados, de `chunk_slots` huecos cada uno
+        self.lock = threading.Lock()  # solo para producir, nunca para leer
+
+    @property
+    def produced(self):
+        return len(self.chunks) * self.chunk_slots
+
+    def ensure(self, slots):
+        """Produce trozos hasta tener al menos `slots` huecos."""
+        with self.lock:
+            while self.produced < slots:
+                self._produce()
+
+    def _produce(self):
+        cfg = self.config
+        first = self.produced
+        chunk = [choose_obstacle(cfg, self.rng, self.spawner, (first + i) * self.period, self.scroll_speed)
+                 for i in range(self.chunk_slots)]
+        self.chunks.append(chunk)
+
+    def slot(self, n):
+        """(tipo, alto, ancho) o None del hueco `n`; True si hubo que generarlo aquí."""
+        index, offset = divmod(n, self.chunk_slots)
+        chunks = self.chunks
+        if index < len(chunks):
+            return chunks[index][offset], False
+        self.ensure((index + 1) * self.chunk_slots)
+        return self.chunks[index][offset], True
+
+
+class ChunkedLevels:
+    """Fuente de obstáculos para `Simulation(levels=...)`."""
+
+    positional = False  # un obstáculo por hueco de tiempo (ver gd.levelfile)
+
+    def __init__(self, config, ahead_px=None, chunk_px=None, background=True):
+        self.config = config
+        self.ahead_px = 3 * config.width if ahead_px is None else ahead_px
+        self.chunk_px = 2 * config.width if chunk_px is None else chunk_px
+        self.current = None
+        self.upcoming = None  # primer trozo del nivel siguiente
+        self.next_slot = 0
+        self.misses = 0  # trozos que tuvo que generar el bucle de juego
+        self.wake = threading.Event()
+        self.running = background
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self._run, name="gd-levels", daemon=True)
+            self.thread.start()
+
+    def _slots(self, px, scroll_speed):
+        period = math.floor(self.config.obstacle_ticks) + 1
+        return max(1, math.ceil(px / (period * max(scroll_speed, 1))))
+
+    def _layout(self, rng, level, scroll_speed):
+        for layout in (self.current, self.upcoming):
+            if (layout is not None and layout.level == level and layout.scroll_speed == scroll_speed
+                    and layout.seed == rng.seed):
+                return layout
+        return LevelLayout(self.config, rng, level, scroll_speed, self._slots(self.chunk_px, scroll_speed))
+
+    def start_level(self, rng, level, scroll_speed):
+        """Lo llama `Simulation.reset_game`: cada intento empieza el nivel de cero,
+        pero con la misma secuencia, así que los trozos ya hechos se reutilizan."""
+        cfg = self.config
+        self.current = self._layout(rng, level, scroll_speed)
+        self.upcoming = self._layout(rng, level + 1, cfg.scroll_speed_base + level * cfg.speed_per_level)
+        self.next_slot = 0
+        self.wake.set()
+
+    def next_obstacle(self):
+        layout = self.current
+        choice, missed = layout.slot(self.next_slot)
+        self.next_slot += 1
+        if missed:
+            self.misses += 1
+        if self.next_slot % layout.chunk_slots == 0:
+            self.wake.set()  # cruzó un trozo: que el productor se adelante
+        return choice
+
+    def _run(self):
+        while self.running:
+            self.wake.wait(0.1)
+            self.wake.clear()
+            current, upcoming = self.current, self.upcoming
+            if current is None:
+                continue
+            current.ensure(self.next_slot + self._slots(self.ahead_px, current.scroll_speed))
+            if upcoming is not None:
+                upcoming.ensure(upcoming.chunk_slots)
+
+    def close(self):
+        self.running = False
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join()
@@ -0,0 +1,83 @@
+"""Variantes del juego como presets con nombre, leídos de `presets.toml`.
+
+El archivo se lee y valida una sola vez por proceso; `get_preset()`
+devuelve una `Config` nueva cada vez, así que se puede modificar sin
+afectar a las demás.
+"""
+import os
+import tomllib
+from dataclasses import fields, replace
+from functools import lru_cache
+
+from gd.core import ROTATION_MODES, Config
+
+PRESETS_FILE = os.path.join(os.path.dirname(__file__), "presets.toml")
+
+
+class PresetError(ValueError):
+    pass
+
+
+def _check_value(preset, field, value):
+    where = f"preset {preset!r}, campo {field.name!r}"
+    kind = field.type
+    if kind is bool:
+        ok = isinstance(value, bool)
+    elif kind is tuple:
+        ok = (isinstance(value, list) and len(value) == 2
+              and all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+              and value[0] <= value[1])
+        value = tuple(value) if ok else value
+    elif kind is float:
+        ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        ok = isinstance(value, kind) and not isinstance(value, bool)
+    if not ok:
+        expected = {bool: "true/false", tuple: "[min, max]", float: "un número",
+                    int: "un entero", str: "texto"}[kind]
+        raise PresetError(f"{where}: se esperaba {expected}, no {value!r}")
+    return value
+
+
+def validate(name, table):
+    """Convierte una tabla del TOML en `Config`, o lanza `PresetError`."""
+    known = {f.name: f for f in fields(Config)}
+    unknown = set(table) - set(known)
+    if unknown:
+        raise PresetError(f"preset {name!r}: campos desconocidos: {', '.join(sorted(unknown))}")
+    values = {key: _check_value(name, known[key], value) for key, value in table.items()}
+    config = Config(**values)
+    if config.rotation not in ROTATION_MODES:
+        raise PresetError(f"preset {name!r}: rotation debe ser uno de {', '.join(ROTATION_MODES)}")
+    if config.tick_rate <= 0 or config.gravity <= 0 or config.jump_velocity >= 0:
+        raise PresetError(f"preset {name!r}: tick_rate y gravity deben ser > 0 y jump_velocity < 0")
+    if config.ground_height >= config.height:
+        raise PresetError(f"preset {name!r}: ground_height no cabe en la ventana")
+    return config
+
+
+@lru_cache(maxsize=None)
+def load_presets(path=PRESETS_FILE):
+    """Lee y valida el archivo de presets (una vez por ruta)."""
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    tables = data.get("presets", {})
+    presets = {name: validate(name, table) for name, table in tables.items()}
+    default = data.get("default")
+    if default not in presets:
+        raise PresetError(f"el preset por defecto {default!r} no existe")
+    return default, presets
+
+
+def preset_names(path=PRESETS_FILE):
+    return sorted(load_presets(path)[1])
+
+
+def get_preset(name=None, path=PRESETS_FILE):
+    """Devuelve una copia de la `Config` del preset `name` (o del preset por defecto)."""
+    default, presets = load_presets(path)
+    name = default if name is None else name
+    try:
+        return replace(presets[name])
+    except KeyError:
+        raise PresetError(f"preset desconocido {name!r}; disponibles: {', '.join(sorted(presets))}") from None
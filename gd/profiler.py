@@ -0,0 +1,157 @@
+"""Perfilador de tiempo por frame, separado por fases del bucle principal.
+
+Cada fase se mide con `time.perf_counter_ns()` por vueltas: `mark(fase)`
+suma a esa fase el tiempo transcurrido desde la marca anterior, así que
+medir cuesta una llamada por fase. La simulación y el renderer marcan sus
+propias fases si tienen un `profiler` asignado (None = sin coste).
+
+Muestra p50/p99 de una ventana móvil en pantalla y, al salir, puede volcar
+la traza de todos los frames medidos a CSV o JSON. `counters()` junta los
+contadores de cachés y pools (textos, capas, rotaciones, obstáculos) para
+comprobar que siguen acertando en partidas largas:
+
+    python geo5.6.py --profile --profile-out traza.csv    # F1 lo alterna
+"""
+import csv
+import json
+import math
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+
+from gd.core import rotation_cache
+
+# En el orden en que ocurren dentro de un frame
+PHASES = (
+    "events",       # lectura de la entrada
+    "transition",   # acumulador y transición de nivel
+    "player",       # física y rotación del jugador
+    "obstacles",    # desplazamiento de obstáculos
+    "collision",
+    "spawn",        # generación, distancia y cambio de nivel
+    "background",   # parallax (o restaurar zonas sucias)
+    "ground",
+    "sprites",
+    "hud",
+    "overlays",
+    "flip",
+)
+
+
+def percentile(values, q):
+    """Percentil `q` (0-100) por el rango más cercano; 0 si no hay muestras."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered) / 100) - 1))
+    return ordered[k]
+
+
+def counters(sim, renderer=None, levels=None, bot=None):
+    """Contadores acumulados de la sesión: {nombre: valor}."""
+    pool = sim.obstacles.pool
+    result = {
+        "rotaciones": rotation_cache.rotations,
+        "obstáculos creados": pool.created,
+        "obstáculos reutilizados": pool.reused,
+    }
+    if renderer is not None:
+        text = renderer.text_cache.stats()
+        result["textos en caché"] = text["entries"]
+        result["aciertos de texto"] = f"{text['hit_rate']:.1%}"
+        result["capas compuestas"] = renderer.transition_overlay.builds + renderer.game_over_overlay.builds
+    if levels is not None and hasattr(levels, "misses"):
+        result["trozos sin adelantar"] = levels.misses
+    if bot is not None and hasattr(bot, "plans"):
+        result["planes del bot"] = bot.plans
+    return result
+
+
+def format_counters(values):
+    return ", ".join(f"{name} {value}" for name, value in values.items())
+
+
+class FrameProfiler:
+    def __init__(self, window=240, trace=False, refresh=15):
+        self.window = window  # frames de la ventana móvil de p50/p99
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.totals = deque(maxlen=window)
+        self.trace = [] if trace else None  # una fila de ns por frame
+        self.refresh = refresh  # frames entre recálculos del panel
+        self.frames = 0
+        self.frame = dict.fromkeys(PHASES, 0)
+        self.last = 0
+        self.summary = {}
+        self.panel = None  # superficie del panel, recompuesta al refrescar
+
+    def begin_frame(self):
+        self.frame = dict.fromkeys(PHASES, 0)
+        self.last = perf_counter_ns()
+
+    def mark(self, phase):
+        now = perf_counter_ns()
+        self.frame[phase] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        frame = self.frame
+        total = 0
+        for phase in PHASES:
+            self.samples[phase].append(frame[phase])
+            total += frame[phase]
+        self.totals.append(total)
+        if self.trace is not None:
+            self.trace.append([frame[phase] for phase in PHASES] + [total])
+        self.frames += 1
+        if self.frames % self.refresh == 1 or self.refresh <= 1:
+            self.summary = self.stats()
+            self.panel = None
+
+    def stats(self):
+        """{fase: (p50_ms, p99_ms)} de la ventana actual, incluido "total"."""
+        rows = {phase: self.samples[phase] for phase in PHASES}
+        rows["total"] = self.totals
+        return {phase: (percentile(v, 50) / 1e6, percentile(v, 99) / 1e6)
+                for phase, v in rows.items()}
+
+    def build_panel(self, text_cache):
+        size = 16
+        line = size + 2
+        panel = pygame.Surface((210, line * (len(PHASES) + 2) + 8))
+        panel.fill((15, 15, 20))
+        columns = (6, 100, 155)
+        for label, cx in zip(("fase", "p50 ms", "p99 ms"), columns):
+            text_cache.draw(panel, label, size, cx, 4, color=(150,150,150))
+        for i, (phase, (p50, p99)) in enumerate(self.summary.items(), 1):
+            color = (255,255,150) if phase == "total" else (200,200,200)
+            for text, cx in zip((phase, f"{p50:.2f}", f"{p99:.2f}"), columns):
+                text_cache.draw(panel, text, size, cx, 4 + i * line, color=color)
+        return panel
+
+    def draw(self, screen, text_cache, x=None, y=90):
+        """Panel con p50/p99 por fase; devuelve el rectángulo ocupado."""
+        if self.panel is None:
+            self.panel = self.build_panel(text_cache)
+        x = screen.get_width() - self.panel.get_width() - 10 if x is None else x
+        return screen.blit(self.panel, (x, y))
+
+    def dump(self, path):
+        """Vuelca la traza por frame; JSON si `path` termina en .json, si no CSV."""
+        if self.trace is None:
+            raise ValueError("el perfilador no guarda traza (trace=False)")
+        columns = [f"{phase}_ns" for phase in PHASES] + ["total_ns"]
+        if path.endswith(".json"):
+            data = {
+                "columns": columns,
+                "frames": self.trace,
+                "summary_ms": {phase: {"p50": p50, "p99": p99} for phase, (p50, p99) in self.stats().items()},
+            }
+            with open(path, "w") as f:
+                json.dump(data, f)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame"] + columns)
+                for i, row in enumerate(self.trace):
+                    writer.writerow([i] + row)
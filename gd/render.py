@@ -0,0 +1,296 @@
+"""Capa de dibujo: pinta en pantalla el estado de una `Simulation`."""
+import pygame
+
+from gd.core import RunRandom
+
+
+BG_KEY = (255, 0, 255)  # color transparente de las tiras del fondo
+PARALLAX_SPEEDS = (0.15, 0.20, 0.25)  # una tira por velocidad
+STRIPE = 40  # periodo de las franjas del suelo
+
+
+def _prepare(surf):
+    """Convierte al formato de la pantalla si hay una, para blits más rápidos."""
+    if pygame.display.get_surface() is not None:
+        return surf.convert()
+    return surf
+
+
+class OverlayCache:
+    """Capa a pantalla completa (fondo translúcido + textos centrados) compuesta
+    una sola vez por cambio de estado y reutilizada mientras no cambie.
+
+    `lines` son tuplas (texto, tamaño, x, y, color); si el nivel o el puntaje
+    cambian, cambian las líneas y la capa se recompone.
+    """
+
+    def __init__(self, size, text_cache):
+        self.size = size
+        self.text_cache = text_cache
+        self.key = None
+        self.surface = None
+        self.builds = 0
+
+    def get(self, alpha, lines):
+        key = (alpha, tuple(lines))
+        if key != self.key:
+            surf = pygame.Surface(self.size, pygame.SRCALPHA)
+            surf.fill((0, 0, 0, alpha))
+            for text, size, x, y, color in lines:
+                self.text_cache.draw(surf, text, size, x, y, True, color)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self.surface = surf
+            self.key = key
+            self.builds += 1
+        return self.surface
+
+
+class Renderer:
+    def __init__(self, screen, config, text_cache, rng=None, previous=None):
+        self.screen = screen
+        self.rng = rng or RunRandom()  # usa su flujo `background`
+        self.config = config
+        self.text_cache = text_cache
+        self.transition_overlay = OverlayCache((config.width, config.height), text_cache)
+        self.game_over_overlay = OverlayCache((config.width, config.height), text_cache)
+        self.bg_color = (30, 30, 40)
+        self.bg_layers = []
+        self.ground = self.build_ground()
+        self.ground_offset = 0.0
+        self.profiler = None  # gd.profiler.FrameProfiler: marca las fases y muestra su panel
+        if previous is not None:
+            # Al cambiar de renderer, el mismo fondo: sin volver a sacar del flujo `background`
+            self.bg_layers = previous.bg_layers
+            self.ground_offset = previous.ground_offset
+        else:
+            self.reset_background()
+
+    def build_ground(self):
+        """Suelo con sus franjas en una sola superficie, una franja más ancha que la pantalla."""
+        cfg = self.config
+        ground = pygame.Surface((cfg.width + STRIPE, cfg.ground_height))
+        ground.fill((30,30,30))
+        for i in range(0, cfg.width + STRIPE, STRIPE):
+            pygame.draw.rect(ground, (45,45,45), (i, 0, 20, cfg.ground_height))
+        return _prepare(ground)
+
+    def reset_background(self):
+        """Regenera el fondo parallax más sutil, horneado en tiras cíclicas."""
+        cfg = self.config
+        strip_width = max(8 * 250, cfg.width)
+        max_h = 80
+        rng = self.rng.background
+        self.bg_layers = []
+        for speed in PARALLAX_SPEEDS:
+            strip = pygame.Surface((strip_width, max_h))
+            strip.fill(BG_KEY)
+            strip.set_colorkey(BG_KEY)
+            self.bg_layers.append([_prepare(strip), speed, 0.0])
+        for i in range(8):
+            x = i * 250
+            h = rng.randint(30, 80)
+            w = rng.randint(25,60)
+            # Color muy sutil para que no distraiga
+            color_val = 35 + i*2
+            strip = self.bg_layers[i % 3][0]
+            pygame.draw.rect(strip, (color_val, color_val+5, color_val+10), (x, max_h - h, w, h))
+
+    def invalidate(self):
+        """Pide repintar la pantalla entera en el próximo frame (aquí, siempre)."""
+
+    def handle_events(self, events):
+        if "reset" in events:
+            self.reset_background()
+
+    def draw_text(self, text, size, x, y, center=False, color=(255,255,255)):
+        return self.text_cache.draw(self.screen, text, size, x, y, center, color)
+
+    def draw(self, sim, alpha=1.0, dt=None):
+        """Dibuja el estado interpolado `alpha` entre el tick anterior y el actual.
+
+        `dt` son los ms reales del frame; el parallax avanza en proporción a
+        ellos para que su velocidad no dependa de los FPS. Devuelve la lista
+        de rectángulos a actualizar, o None si cambió toda la pantalla.
+        """
+        ticks = 1.0 if dt is None else dt / self.config.tick_ms
+        prof = self.profiler
+        self.draw_background(sim, ticks)
+        self.draw_sprites(sim, alpha)
+        if prof:
+            prof.mark("sprites")
+        self.draw_hud(sim)
+        if prof:
+            prof.mark("hud")
+        self.draw_overlays(sim)
+        if prof:
+            prof.mark("overlays")
+        return None
+
+    def draw_background(self, sim, ticks=1.0):
+        cfg = self.config
+        screen = self.screen
+        ground_y = cfg.ground_y
+
+        screen.fill(self.bg_color)
+
+        # Fondo parallax sutil: dos blits por tira para cubrir el salto de ciclo
+        for layer in self.bg_layers:
+            strip, speed, offset = layer
+            strip_width, strip_height = strip.get_size()
+            offset = (offset + sim.scroll_speed * speed * ticks) % strip_width  # Velocidad muy reducida
+            layer[2] = offset
+            x = -int(offset)
+            screen.blit(strip, (x, ground_y - strip_height))
+            if x + strip_width < cfg.width:
+                screen.blit(strip, (x + strip_width, ground_y - strip_height))
+        if self.profiler:
+            self.profiler.mark("background")
+
+        # Suelo: avanza con los obstáculos
+        if sim.scrolled:
+            self.ground_offset = (self.ground_offset + sim.scroll_speed * ticks) % STRIPE
+        screen.blit(self.ground, (-int(self.ground_offset), ground_y))
+        if self.profiler:
+            self.profiler.mark("ground")
+
+    def draw_sprites(self, sim, alpha=1.0):
+        """Dibuja obstáculos y jugador; devuelve los rectángulos ocupados."""
+        screen = self.screen
+        ob_alpha = alpha if sim.scrolled else 1.0
+        # Solo los obstáculos en pantalla (margen de un paso de scroll por la interpolación)
+        margin = int(sim.scroll_speed) + 1
+        rects = [ob.draw(screen, ob_alpha)
+                 for ob in sim.obstacles.window(-margin, self.config.width + margin)]
+        rects.append(sim.player.draw(screen, alpha))
+        return rects
+
+    def draw_hud(self, sim):
+        cfg = self.config
+        screen = self.screen
+        rects = [
+            self.draw_text(f"Nivel: {sim.current_level}", 24, 12, 8, color=(100,200,255)),
+            self.draw_text(f"Progreso: {int(sim.distance)}/{sim.level_distance}", 20, 12, 38),
+            self.draw_text(f"Record: {sim.highscore}", 18, 12, 64),
+        ]
+
+        # Barra de progreso
+        progress_width = 200
+        progress_x = cfg.width - progress_width - 20
+        progress_y = 20
+        progress_fill = min(1.0, sim.distance / sim.level_distance) * progress_width
+        pygame.draw.rect(screen, (60,60,60), (progress_x, progress_y, progress_width, 15))
+        pygame.draw.rect(screen, (100,255,100), (progress_x, progress_y, progress_fill, 15))
+        rects.append(pygame.draw.rect(screen, (150,150,150), (progress_x, progress_y, progress_width, 15), 2))
+
+        # Panel del perfilador
+        if self.profiler:
+            rects.append(self.profiler.draw(screen, self.text_cache))
+        return rects
+
+    def overlay(self, sim):
+        """Superficie de la capa a pantalla completa activa, o None. Es el mismo
+        objeto mientras la capa no cambie (ver `OverlayCache`)."""
+        cfg = self.config
+        width, height = cfg.width, cfg.height
+
+        # Transición de nivel
+        if sim.show_level_transition:
+            return self.transition_overlay.get(150, (
+                (f"NIVEL {sim.current_level}", 64, width//2, height//2 - 30, (100,255,100)),
+                (cfg.transition_text, 36, width//2, height//2 + 30, (255,255,100)),
+            ))
+
+        # Pantalla de GAME OVER
+        if sim.show_game_over:
+            return self.game_over_overlay.get(180, (
+                ("GAME OVER", 72, width//2, height//2 - 60, (255,80,80)),
+                (f"Puntaje: {int(sim.distance)}", 36, width//2, height//2, (255,255,255)),
+                (f"Record: {sim.highscore}", 32, width//2, height//2 + 40, (255,255,255)),
+                ("Presiona Abajo para continuar", 28, width//2, height//2 + 100, (255,255,150)),
+            ))
+        return None
+
+    def draw_overlays(self, sim):
+        """Dibuja la capa a pantalla completa activa; devuelve True si hubo alguna."""
+        surface = self.overlay(sim)
+        if surface is None:
+            return False
+        self.screen.blit(surface, (0, 0))
+        return True
+
+
+class DirtyRenderer(Renderer):
+    """Renderer de rectángulos sucios para equipos lentos.
+
+    El fondo (parallax y suelo) queda fijo en una superficie; cada frame solo
+    se borran y redibujan las zonas del jugador, los obstáculos y el HUD, y
+    `draw()` devuelve esos rectángulos para `pygame.display.update(rects)`.
+
+    Una capa a pantalla completa (transición, GAME OVER) se dibuja una vez
+    sobre la escena y la pantalla se deja quieta mientras la capa no cambie;
+    al cerrarse se repinta entera desde el fondo guardado.
+    """
+
+    def __init__(self, screen, config, text_cache, rng=None, previous=None):
+        self.background = None
+        self.prev_rects = []
+        self.shown_overlay = None  # capa que está ahora en pantalla
+        super().__init__(screen, config, text_cache, rng, previous)
+
+    def reset_background(self):
+        super().reset_background()
+        self.invalidate()
+
+    def invalidate(self):
+        self.background = None
+        self.shown_overlay = None
+
+    def draw(self, sim, alpha=1.0, dt=None):
+        screen = self.screen
+        prof = self.profiler
+        overlay = self.overlay(sim)
+        if overlay is not None and overlay is self.shown_overlay:
+            # Nada nuevo que mostrar: la escena queda detrás de la misma capa
+            if prof:
+                prof.mark("overlays")
+            return []
+
+        full = self.background is None
+        if full:
+            self.draw_background(sim)
+            self.background = screen.copy()
+            self.prev_rects = []
+        elif self.shown_overlay is not None:
+            # La capa se acaba de cerrar: quitarla de toda la pantalla
+            screen.blit(self.background, (0, 0))
+            self.prev_rects = []
+            full = True
+        self.shown_overlay = None
+
+        # Borrar lo dibujado en el frame anterior
+        for r in self.prev_rects:
+            screen.blit(self.background, r, r)
+        if prof:
+            prof.mark("background")
+
+        rects = self.draw_sprites(sim, alpha)
+        if prof:
+            prof.mark("sprites")
+        rects.extend(self.draw_hud(sim))
+        if prof:
+            prof.mark("hud")
+        if overlay is not None:
+            # Cubre toda la pantalla y se queda hasta que cambie o se cierre
+            screen.blit(overlay, (0, 0))
+            self.shown_overlay = overlay
+            self.prev_rects = []
+            if prof:
+                prof.mark("overlays")
+            return None
+        if prof:
+            prof.mark("overlays")
+
+        dirty = self.prev_rects + rects
+        self.prev_rects = rects
+        return None if full else dirty
@@ -0,0 +1,185 @@
+"""Grabación y reproducción de partidas en un formato binario compacto.
+
+Un archivo de repetición guarda la semilla, la configuración y la
+entrada tick a tick, codificada por longitud de rachas: pares
+(máscara, largo) como varints LEB128, donde la máscara combina
+JUMP (1) y RESTART (2).
+Como la simulación es determinista con semilla, eso basta para
+reconstruir la partida entera.
+
+    python -m gd.replay partida.gdr      # reproduce sin pantalla y verifica el récord
+"""
+import json
+import struct
+import sys
+import time
+from dataclasses import asdict, fields
+
+from gd.core import Config, Simulation
+from gd.worker import atomic_write
+
+MAGIC = b"GDRP"
+VERSION = 2
+JUMP = 1
+RESTART = 2
+# magic, versión, semilla, ticks, nivel final, mejor distancia, largo del config
+_HEADER = struct.Struct("<4sBQIHIH")
+
+
+class ReplayError(Exception):
+    pass
+
+
+# ---------- VARINTS ----------
+def _write_varint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varints(data, pos):
+    value = shift = 0
+    for byte in data[pos:]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+    if shift:
+        raise ReplayError("varint truncado al final del archivo")
+
+
+# ---------- FORMATO ----------
+class Replay:
+    """Una partida grabada: semilla, config y rachas de entrada."""
+
+    def __init__(self, seed, config, runs=(), ticks=0, level=1, best=0):
+        self.seed = seed
+        self.config = config
+        self.runs = list(runs)  # pares (máscara, largo)
+        self.ticks = ticks
+        self.level = level
+        self.best = best
+
+    def inputs(self):
+        """Genera la entrada `(jump, restart)` de cada tick."""
+        for mask, run in self.runs:
+            value = (bool(mask & JUMP), bool(mask & RESTART))
+            for _ in range(run):
+                yield value
+
+    def to_bytes(self):
+        config = json.dumps(asdict(self.config), separators=(",", ":")).encode()
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, self.ticks,
+                                     self.level, self.best, len(config)))
+        out += config
+        for mask, run in self.runs:
+            _write_varint(out, mask)
+            _write_varint(out, run)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < _HEADER.size:
+            raise ReplayError("archivo de repetición demasiado corto")
+        magic, version, seed, ticks, level, best, config_len = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("no es un archivo de repetición")
+        if version not in (1, VERSION):
+            raise ReplayError(f"versión de repetición no soportada: {version}")
+        start = _HEADER.size
+        raw = json.loads(data[start:start + config_len])
+        names = {f.name for f in fields(Config)}
+        config = Config(**{k: tuple(v) if isinstance(v, list) else v
+                           for k, v in raw.items() if k in names})
+        values = list(_read_varints(data, start + config_len))
+        if version == 1:
+            # v1: solo saltos, rachas alternas empezando por "sin salto"
+            runs = [(i % 2 * JUMP, run) for i, run in enumerate(values)]
+        else:
+            if len(values) % 2:
+                raise ReplayError("rachas de entrada incompletas")
+            runs = list(zip(values[::2], values[1::2]))
+        return cls(seed, config, runs, ticks, level, best)
+
+    def save(self, path):
+        atomic_write(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Acumula la entrada de cada tick como rachas mientras se juega."""
+
+    def __init__(self, seed, config):
+        self.replay = Replay(seed, config)
+        self._mask = 0
+        self._run = 0
+
+    def record(self, jump, restart=False):
+        mask = (JUMP if jump else 0) | (RESTART if restart else 0)
+        if mask != self._mask and self._run:
+            self.replay.runs.append((self._mask, self._run))
+            self._run = 0
+        self._mask = mask
+        self._run += 1
+        self.replay.ticks += 1
+
+    def finish(self, sim):
+        """Cierra la última racha y anota el resultado de la partida."""
+        replay = self.replay
+        if self._run:
+            replay.runs.append((self._mask, self._run))
+            self._run = 0
+        replay.level = sim.current_level
+        replay.best = sim.best_distance
+        return replay
+
+
+# ---------- REPRODUCCIÓN SIN PANTALLA ----------
+def fast_forward(replay):
+    """Reproduce la partida sin dibujar y devuelve la simulación final."""
+    sim = Simulation(replay.config, seed=replay.seed)
+    step = sim.step
+    for jump, restart in replay.inputs():
+        step(jump, restart)
+    return sim
+
+
+def verify(replay):
+    """True si la reproducción llega al mismo nivel y mejor distancia grabados."""
+    sim = fast_forward(replay)
+    return sim.current_level == replay.level and sim.best_distance == replay.best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("uso: python -m gd.replay ARCHIVO.gdr [...]")
+        return 2
+    status = 0
+    for path in argv:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        sim = fast_forward(replay)
+        elapsed = time.perf_counter() - start
+        ok = sim.current_level == replay.level and sim.best_distance == replay.best
+        status = status or (0 if ok else 1)
+        print(f"{path}: semilla {replay.seed}, {replay.ticks} ticks, "
+              f"nivel {sim.current_level}, mejor {sim.best_distance} "
+              f"({'OK' if ok else f'NO COINCIDE: grabado nivel {replay.level}, mejor {replay.best}'}) "
+              f"- {replay.ticks / max(elapsed, 1e-9):.0f} ticks/s")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Persistencia de puntajes: récord atómico y tabla de líderes en SQLite.
+
+Nada de esto escribe en el hilo del bucle de juego: `ScoreStore` encola
+las escrituras en un `gd.worker.IOWorker`, que las hace en su propio hilo.
+El récord se reescribe con archivo temporal + `os.replace`, así que un
+corte a mitad de escritura deja el valor anterior, nunca un archivo vacío.
+
+    python -m gd.scores --preset 5.6 -n 10       # top 10 del preset
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+from gd.worker import IOWorker, atomic_write
+
+HIGHSCORE_FILE = "gd_highscore.txt"
+SCORES_DB = "gd_scores.db"
+DEFAULT_PROFILE = "jugador"
+
+
+# ---------- TABLA DE LÍDERES ----------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    distance INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_preset ON scores (preset, distance DESC);
+CREATE INDEX IF NOT EXISTS scores_by_level ON scores (preset, level, distance DESC);
+CREATE INDEX IF NOT EXISTS scores_by_profile ON scores (profile, preset, distance DESC);
+"""
+
+
+class Leaderboard:
+    """Partidas por perfil, preset y nivel. Una instancia por hilo (sqlite3)."""
+
+    def __init__(self, path=SCORES_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # lecturas sin bloquear al escritor
+        self.conn.executescript(SCHEMA)
+
+    def add(self, profile, preset, level, distance, created=None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO scores (profile, preset, level, distance, created) VALUES (?, ?, ?, ?, ?)",
+                (profile, preset, level, int(distance), time.time() if created is None else created))
+
+    def top(self, preset, level=None, profile=None, n=10):
+        """Las `n` mejores partidas: [(perfil, nivel, distancia, fecha), ...]."""
+        where = ["preset = ?"]
+        params = [preset]
+        if level is not None:
+            where.append("level = ?")
+            params.append(level)
+        if profile is not None:
+            where.append("profile = ?")
+            params.append(profile)
+        params.append(n)
+        return self.conn.execute(
+            "SELECT profile, level, distance, created FROM scores WHERE "
+            + " AND ".join(where) + " ORDER BY distance DESC LIMIT ?", params).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+# ---------- ALMACÉN DEL JUEGO ----------
+class ScoreStore:
+    """Récord y tabla de líderes de una sesión (perfil + preset).
+
+    Solo `load_highscore()` lee en el hilo que llama (una vez, al arrancar);
+    `save_highscore()` y `add_run()` vuelven al instante. Sin `worker`
+    propio, crea uno y lo cierra en `close()`.
+    """
+
+    def __init__(self, profile=DEFAULT_PROFILE, preset=None,
+                 highscore_file=HIGHSCORE_FILE, db_path=SCORES_DB, worker=None):
+        self.profile = profile
+        self.preset = preset
+        self.highscore_file = highscore_file
+        self.db_path = db_path
+        self.own_worker = worker is None
+        self.worker = IOWorker() if worker is None else worker
+        self.board = None  # conexión propia del hilo de E/S
+
+    def load_highscore(self):
+        if os.path.exists(self.highscore_file):
+            try:
+                with open(self.highscore_file, "r") as f:
+                    return int(f.read().strip() or 0)
+            except Exception:
+                return 0
+        return 0
+
+    def save_highscore(self, value):
+        self.worker.submit(atomic_write, self.highscore_file, str(value))
+
+    def add_run(self, level, distance):
+        """Guarda una partida terminada en la tabla de líderes."""
+        self.worker.submit(self._add_run, level, int(distance), time.time())
+
+    def _add_run(self, level, distance, created):
+        if self.board is None:
+            self.board = Leaderboard(self.db_path)
+        self.board.add(self.profile, self.preset, level, distance, created)
+
+    def _close_board(self):
+        if self.board is not None:
+            self.board.close()
+            self.board = None
+
+    def close(self):
+        """Cierra la base de datos tras las escrituras pendientes."""
+        self.worker.submit(self._close_board)
+        if self.own_worker:
+            self.worker.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabla de líderes")
+    parser.add_argument("--preset", help="preset (por defecto, el de gd/presets.toml)")
+    parser.add_argument("--level", type=int, help="solo este nivel")
+    parser.add_argument("--player", help="solo este perfil")
+    parser.add_argument("-n", type=int, default=10, help="cuántas partidas mostrar")
+    parser.add_argument("--db", default=SCORES_DB)
+    args = parser.parse_args(argv)
+    if args.preset is None:
+        from gd.presets import load_presets
+        args.preset = load_presets()[0]
+    if not os.path.exists(args.db):
+        print(f"{args.db}: no hay partidas guardadas")
+        return 1
+    board = Leaderboard(args.db)
+    try:
+        for rank, (profile, level, distance, created) in enumerate(
+                board.top(args.preset, args.level, args.player, args.n), 1):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(created))
+            print(f"{rank:>3}. {profile:<16} nivel {level:<3} {distance:>8}  {when}")
+    finally:
+        board.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Barrido de parámetros de dificultad con simulaciones sin pantalla.
+
+Reparte una rejilla de configuraciones entre un pool de procesos; cada
+combinación se juega con un bot (`--bot`) en varias semillas y se resume en
+una fila CSV (supervivencia, superabilidad y ticks/s).
+
+    python -m gd.sweep --gravity 0.5 0.8 --jump-velocity -10 -15 \\
+        --tick-rate 60 80 --seeds 8 --ticks 20000 --out barrido.csv
+
+Los campos que no se barren salen del preset elegido con `--preset`,
+salvo `fair_spawns`: va apagado (si no, el generador descarta los
+obstáculos imposibles y no hay dificultad que medir) a menos que se pida
+`--fair-spawns`. La columna `rejected` cuenta los candidatos descartados.
+"""
+import argparse
+import csv
+import itertools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+from gd.bot import BOTS
+from gd.core import Simulation
+from gd.presets import get_preset, preset_names
+
+# Parámetros barribles: nombre del campo de Config -> tipo de cada valor
+SWEEP_FIELDS = {
+    "tick_rate": int,
+    "gravity": float,
+    "jump_velocity": float,
+    "scroll_speed_base": float,
+    "obstacle_freq": int,
+    "spike_height": str,
+    "spike_width": str,
+}
+
+CSV_COLUMNS = list(SWEEP_FIELDS) + [
+    "seeds", "ticks", "attempts", "mean_survival", "best_distance",
+    "max_level", "clearability", "rejected", "ticks_per_sec",
+]
+
+
+def parse_range(text):
+    """'40-50' -> (40, 50)"""
+    lo, hi = text.split("-")
+    return (int(lo), int(hi))
+
+
+def play(config, seed, ticks, bot="scripted"):
+    """Juega `ticks` ticks con el bot y devuelve las métricas de la partida."""
+    sim = Simulation(config, seed=seed)
+    bot = BOTS[bot](config)
+    step = sim.step
+    survivals = []
+    crashes = 0
+    carried = 0  # distancia de los niveles ya completados en este intento
+    start = time.perf_counter()
+    for _ in range(ticks):
+        goal = sim.level_distance
+        events = step(bot(sim), True)  # con game_over, continúa en el acto
+        if "crash" in events:
+            survivals.append(carried + sim.distance)
+            crashes += 1
+            carried = 0
+        elif "level" in events:
+            carried += goal
+    elapsed = time.perf_counter() - start
+    # El último intento, aún sin terminar, también cuenta como supervivencia
+    survivals.append(carried + sim.distance)
+    return {
+        "survivals": survivals,
+        "crashes": crashes,
+        "best": int(max(survivals)),  # best_distance solo se actualiza al chocar
+        "level": sim.current_level,
+        "passed": sim.obstacles.culled,
+        "rejected": sim.spawner.rejected if sim.spawner is not None else 0,
+        "elapsed": elapsed,
+    }
+
+
+def run_point(point, seeds, ticks, preset=None, bot="scripted", fair_spawns=False):
+    """Evalúa una combinación de la rejilla en todas las semillas."""
+    config = replace(get_preset(preset), fair_spawns=fair_spawns, **point)
+    results = [play(config, seed, ticks, bot) for seed in range(seeds)]
+    crashes = sum(r["crashes"] for r in results)
+    passed = sum(r["passed"] for r in results)
+    survivals = [d for r in results for d in r["survivals"]]
+    elapsed = sum(r["elapsed"] for r in results)
+    row = {name: point.get(name, getattr(config, name)) for name in SWEEP_FIELDS}
+    row["spike_height"] = "%d-%d" % config.spike_height
+    row["spike_width"] = "%d-%d" % config.spike_width
+    row.update({
+        "seeds": seeds,
+        "ticks": ticks,
+        "attempts": crashes,
+        "mean_survival": round(sum(survivals) / len(survivals), 1),
+        "best_distance": max(r["best"] for r in results),
+        "max_level": max(r["level"] for r in results),
+        "clearability": round(passed / (passed + crashes), 4) if passed + crashes else "",
+        "rejected": sum(r["rejected"] for r in results),
+        "ticks_per_sec": round(seeds * ticks / elapsed) if elapsed else "",
+    })
+    return row
+
+
+def grid(values):
+    """Producto cartesiano de {campo: [valores]} -> lista de dicts."""
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*values.values())]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de dificultad")
+    for name, kind in SWEEP_FIELDS.items():
+        flag = "--" + name.replace("_", "-")
+        if kind is str:
+            parser.add_argument(flag, nargs="+", type=parse_range, metavar="MIN-MAX")
+        else:
+            parser.add_argument(flag, nargs="+", type=kind)
+    parser.add_argument("--preset", choices=preset_names(), help="variante base (por defecto, la de gd/presets.toml)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="scripted", help="jugador automático")
+    parser.add_argument("--fair-spawns", action="store_true",
+                        help="deja el generador de obstáculos superables (gd.jumps)")
+    parser.add_argument("--seeds", type=int, default=4, help="semillas por combinación")
+    parser.add_argument("--ticks", type=int, default=20000, help="ticks por partida")
+    parser.add_argument("--workers", type=int, default=None, help="procesos (por defecto, uno por CPU)")
+    parser.add_argument("--out", default="-", help="CSV de salida ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    values = {name: getattr(args, name) for name in SWEEP_FIELDS if getattr(args, name)}
+    points = grid(values)
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    try:
+        writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            jobs = [pool.submit(run_point, p, args.seeds, args.ticks, args.preset, args.bot, args.fair_spawns)
+                    for p in points]
+            for job in jobs:
+                writer.writerow(job.result())
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
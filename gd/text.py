@@ -0,0 +1,72 @@
+import re
+from collections import OrderedDict
+
+import pygame
+
+# Cada dígito se cachea por separado; el resto del texto se agrupa en tramos.
+_SEGMENT_RE = re.compile(r"\d|\D+")
+
+
+class TextCache:
+    """Registro de fuentes por tamaño y caché LRU de textos renderizados.
+
+    Las etiquetas fijas ("GAME OVER", "Record: ") se renderizan una sola vez;
+    en las que cambian cada frame solo se renderizan los dígitos nuevos.
+    """
+
+    def __init__(self, font_name=None, max_entries=256):
+        self.font_name = font_name
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size):
+        f = self.fonts.get(size)
+        if f is None:
+            f = pygame.font.Font(self.font_name, size)
+            self.fonts[size] = f
+        return f
+
+    def render(self, text, size, color=(255,255,255)):
+        """Devuelve la superficie de `text`, renderizándola solo si no está en caché."""
+        key = (text, size, tuple(color))
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self.font(size).render(text, True, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def draw(self, surf, text, size, x, y, center=False, color=(255,255,255)):
+        parts = [self.render(seg, size, color) for seg in _SEGMENT_RE.findall(text)]
+        width = sum(p.get_width() for p in parts)
+        height = max((p.get_height() for p in parts), default=0)
+        if center:
+            x -= width // 2
+            y -= height // 2
+        for p in parts:
+            surf.blit(p, (x, y))
+            x += p.get_width()
+        return pygame.Rect(x - width, y, width, height)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self.surfaces), "fonts": len(self.fonts),
+                "hit_rate": round(self.hit_rate(), 4)}
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,88 @@
+"""Hilo de E/S para todas las escrituras a disco durante la partida.
+
+El bucle de juego nunca toca el disco: encola un trabajo con `submit()`
+y sigue. La cola es acotada; si se llena (disco lento), `submit()` espera
+a que haya sitio, lo que se anota en `stalls`/`stall_ms` para verlo al salir.
+
+`close()` termina los trabajos pendientes y el hilo; el juego lo llama al
+salir, también si el bucle termina con una excepción.
+"""
+import contextlib
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+
+def atomic_write(path, data):
+    """Reemplaza `path` por `data` (str o bytes) de forma atómica."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crea el archivo como 0600; conservar los permisos de siempre
+        os.chmod(tmp, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+class IOWorker:
+    def __init__(self, maxsize=64, name="gd-io"):
+        self.jobs = queue.Queue(maxsize)
+        self.errors = []  # excepciones de los trabajos (no interrumpen el juego)
+        self.stalls = 0
+        self.stall_ms = 0.0
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, *args):
+        """Encola `fn(*args)`."""
+        if self.closed:
+            raise RuntimeError("IOWorker cerrado")
+        try:
+            self.jobs.put_nowait((fn, args))
+            return
+        except queue.Full:
+            pass
+        # Contrapresión: esperar a que el hilo libere sitio
+        start = time.perf_counter()
+        self.jobs.put((fn, args))
+        self.stalls += 1
+        self.stall_ms += (time.perf_counter() - start) * 1000
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as exc:
+                self.errors.append(exc)
+
+    def close(self):
+        """Termina los trabajos pendientes y el hilo (idempotente)."""
+        if self.closed:
+            return
+        self.closed = True
+        self.jobs.put(None)
+        self.thread.join()
+
+    def report(self, out=sys.stderr):
+        """Escribe en `out` los errores y esperas, si los hubo."""
+        for exc in self.errors:
+            print(f"error de E/S: {exc!r}", file=out)
+        if self.stalls:
+            print(f"E/S: {self.stalls} esperas ({self.stall_ms:.1f} ms)", file=out)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Sin ventana: pygame usa el driver de video "dummy" de SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
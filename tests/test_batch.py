@@ -0,0 +1,49 @@
+"""`BatchSimulation` reproduce tick a tick a `Simulation` con las mismas semillas."""
+from dataclasses import replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gd.batch import BatchSimulation
+from gd.core import Config, Simulation
+from gd.presets import get_preset
+
+RECT = Config(pixel_collision=False)
+CONFIGS = [
+    replace(get_preset("5.1"), pixel_collision=False, fair_spawns=False),
+    replace(get_preset("5.2"), pixel_collision=False, level_distance=300),
+    replace(RECT, gravity=0.8, jump_velocity=-15, scroll_speed_base=5, tick_rate=60,
+            obstacle_freq=1600, level_distance=3000, speed_per_level=1.75),
+    replace(RECT, level_distance=600, level_distance_growth=1.2, score_speed=0),
+]
+
+
+def policy(tick, i):
+    return (tick * 7 + i * 13) % 29 == 0 or (tick % 50 < 2 and i % 2 == 0)
+
+
+def test_batch_matches_scalar():
+    seeds = [1, 2, 3, 4]
+    batch = BatchSimulation(CONFIGS, seeds)
+    sims = [Simulation(c, seed=s) for c, s in zip(CONFIGS, seeds)]
+    for tick in range(8000):
+        jump = np.array([policy(tick, i) for i in range(len(sims))])
+        batch.step(jump)
+        for i, sim in enumerate(sims):
+            sim.step(bool(jump[i]))
+            expected = (sim.player.rect.y, sim.current_level, sim.distance, sim.best_distance, sim.game_active)
+            got = (int(batch.y[i]), int(batch.level[i]), float(batch.distance[i]),
+                   int(batch.best_distance[i]), bool(batch.game_active[i]))
+            assert got == expected, f"tick {tick}, partida {i}"
+    assert batch.crashes.sum() > 0  # la política choca: se probó también el reinicio
+
+
+@pytest.mark.parametrize("override", [
+    {"pixel_collision": True},
+    {"game_over": True},
+    {"rotation": "center"},
+])
+def test_batch_rejects_unsupported_rules(override):
+    with pytest.raises(ValueError):
+        BatchSimulation(replace(RECT, **override), [0])
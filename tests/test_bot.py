@@ -0,0 +1,21 @@
+"""El bot con anticipación juega todos los presets sin chocar."""
+import pytest
+
+from gd.bot import soak
+from gd.presets import get_preset, preset_names
+
+
+@pytest.mark.parametrize("preset", preset_names())
+def test_autopilot_soak_has_no_crashes(preset):
+    result = soak(get_preset(preset), "autopilot", ticks=20000, seed=3)
+    assert result["passed"] > 50
+    assert result["crashes"] == 0
+    assert result["best"] > 0  # sin choques, cuenta el intento en curso
+
+
+def test_sweep_best_counts_unfinished_attempt():
+    from gd.sweep import play
+
+    result = play(get_preset("5.2"), seed=3, ticks=3000, bot="autopilot")
+    assert result["crashes"] == 0
+    assert result["best"] == int(max(result["survivals"])) > 0
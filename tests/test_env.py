@@ -0,0 +1,81 @@
+"""Los entornos son deterministas con semilla y devuelven observaciones de la forma declarada."""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gd.env import GameEnv, VectorGameEnv
+
+
+def rollout(env, actions, seed):
+    obs, info = env.reset(seed=seed)
+    trace = [obs]
+    for action in actions:
+        obs, reward, terminated, truncated, info = env.step(action)
+        trace.append(obs)
+        trace.append(np.array([reward, terminated, truncated]))
+        if np.all(terminated):
+            obs, info = env.reset()
+            trace.append(obs)
+    return trace
+
+
+def actions(shape=()):
+    rng = np.random.default_rng(0)
+    return [rng.random(shape) < 0.05 for _ in range(600)]
+
+
+@pytest.mark.parametrize("preset", ["5.1", "5.6"])
+def test_game_env_is_deterministic(preset):
+    env = GameEnv(preset=preset, k=3)
+    try:
+        steps = [int(a) for a in actions()]
+        first = rollout(env, steps, seed=7)
+        second = rollout(env, steps, seed=7)
+        assert all(np.array_equal(a, b) for a, b in zip(first, second))
+        assert len(first) == len(second)
+    finally:
+        env.close()
+
+
+def test_game_env_observation_shapes():
+    env = GameEnv(preset="5.6", k=5)
+    try:
+        obs, _ = env.reset(seed=1)
+        assert obs.shape == (4 + 4 * 5,) and obs.dtype == np.float32
+    finally:
+        env.close()
+    env = GameEnv(preset="5.6", obs_type="pixels", pixel_size=(112, 50))
+    try:
+        obs, _ = env.reset(seed=1)
+        assert obs.shape == (50, 112, 3) and obs.dtype == np.uint8
+        obs, *_ = env.step(1)
+        assert obs.shape == (50, 112, 3)
+    finally:
+        env.close()
+
+
+def test_vector_env_is_deterministic():
+    env = VectorGameEnv(8, preset="5.6", k=3)
+    try:
+        steps = actions((8,))
+        first = rollout(env, steps, seed=3)
+        assert first[0].shape == (8, 4 + 4 * 3) and first[0].dtype == np.float32
+        second = rollout(env, steps, seed=3)
+        assert all(np.array_equal(a, b) for a, b in zip(first, second))
+    finally:
+        env.close()
+
+
+def test_vector_env_terminates_on_crash():
+    env = VectorGameEnv(4, preset="5.6")
+    try:
+        env.reset(seed=5)
+        terminated_total = 0
+        for _ in range(2000):
+            crashes = env.batch.crashes.copy()
+            _, _, terminated, _, _ = env.step(np.zeros(4, dtype=bool))  # sin saltar: choca
+            assert np.array_equal(terminated, env.batch.crashes != crashes)
+            terminated_total += int(terminated.sum())
+        assert terminated_total > 0
+    finally:
+        env.close()
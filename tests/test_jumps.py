@@ -0,0 +1,46 @@
+"""Con `fair_spawns`, todo obstáculo generado se puede superar."""
+from dataclasses import replace
+
+import pytest
+
+from gd.core import Simulation
+from gd.jumps import FairSpawner
+from gd.presets import get_preset, preset_names
+
+
+class PlannedSpawner(FairSpawner):
+    """Anota, por cada obstáculo aceptado, el tick en que hay que saltar."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.plan = []
+
+    def reset(self):
+        super().reset()
+        self.plan = []
+
+    def place(self, tick, scroll_speed, height, width):
+        ok = super().place(tick, scroll_speed, height, width)
+        if ok:
+            self.plan.append(self.last_jump - self.table.jump_gap + 1)
+        return ok
+
+
+@pytest.mark.parametrize("pixel_collision", [False, True])
+@pytest.mark.parametrize("preset", preset_names())
+def test_spawner_plan_clears_every_obstacle(preset, pixel_collision):
+    # Saltar en el tick más temprano que garantizó el generador nunca choca,
+    # también a velocidades de niveles altos
+    config = replace(get_preset(preset), fair_spawns=True, pixel_collision=pixel_collision,
+                     speed_per_level=2, level_distance=2500)
+    sim = Simulation(config, seed=7)
+    sim.spawner = spawner = PlannedSpawner(config)
+    crashes = 0
+    for _ in range(30000):
+        jump = False
+        if spawner.plan and sim.ticks + 1 >= spawner.plan[0] and sim.player.on_ground and sim.game_active:
+            jump = True
+            spawner.plan.pop(0)
+        crashes += "crash" in sim.step(jump, True)
+    assert sim.obstacles.culled > 50
+    assert crashes == 0
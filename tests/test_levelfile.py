@@ -0,0 +1,94 @@
+"""Niveles .gdl: la distancia del nivel se fija al empezarlo y la cámara
+avanza lo mismo que los obstáculos."""
+import pytest
+
+from gd.core import PLAYER_X, Simulation
+from gd.jumps import JumpTable
+from gd.levelfile import LevelStream, write_level
+from gd.presets import get_preset
+
+
+def stream_sim(tmp_path, config, *files):
+    paths = []
+    for i, (obstacles, length, distance) in enumerate(files):
+        path = str(tmp_path / f"nivel{i}.gdl")
+        write_level(path, obstacles, length, distance)
+        paths.append(path)
+    levels = LevelStream(config, paths)
+    return Simulation(config, seed=3, levels=levels), levels
+
+
+def run_until(sim, done, limit=20000):
+    for _ in range(limit):
+        if done():
+            return
+        sim.step(False, False)
+    raise AssertionError("no terminó")
+
+
+def test_file_distance_set_at_level_start(tmp_path):
+    config = get_preset("5.2")
+    sim, levels = stream_sim(tmp_path, config, ([], 0, 500), ([], 0, 700))
+    try:
+        assert sim.level_distance == 500  # antes del primer tick: el HUD ya la muestra
+        sim.next_level()
+        assert sim.level_distance == 700
+        sim.next_level()  # el primer archivo otra vez: sin crecer
+        assert sim.level_distance == 500
+    finally:
+        levels.close()
+
+
+def test_zero_distance_falls_back_to_scaled_config(tmp_path):
+    config = get_preset("5.2")
+    assert config.level_distance_growth != 1
+    sim, levels = stream_sim(tmp_path, config, ([], 0, 900), ([], 0, 900), ([], 0, 0))
+    try:
+        sim.next_level()
+        sim.next_level()
+        expected = config.level_distance
+        for _ in range(2):
+            expected = int(expected * config.level_distance_growth)
+        assert sim.level_distance == expected
+    finally:
+        levels.close()
+
+
+@pytest.mark.parametrize("start_px", [0, 1000])
+def test_length_ends_level(tmp_path, start_px):
+    config = get_preset("5.2")
+    path = str(tmp_path / "largo.gdl")
+    write_level(path, [], 3000, 0)
+    levels = LevelStream(config, [path], start_px=start_px)
+    try:
+        sim = Simulation(config, seed=3, levels=levels)
+        run_until(sim, lambda: not sim.show_level_transition)
+        step = JumpTable.step(sim.scroll_speed)
+        # El final del nivel tiene que llegar hasta el jugador
+        end = 3000 + config.width + 20 - PLAYER_X
+        camera = levels.camera
+        while sim.current_level == 1:
+            camera = levels.camera
+            sim.step(False, False)
+        assert camera < end <= camera + step
+    finally:
+        levels.close()
+
+
+def test_camera_matches_obstacle_movement(tmp_path):
+    # A 6,25 px/tick los obstáculos avanzan 6 px: la cámara también
+    config = get_preset("5.2")
+    spacing = 600
+    obstacles = [(i * spacing, "spike", 40, 30) for i in range(5)]
+    sim, levels = stream_sim(tmp_path, config, (obstacles, None, 100000))
+    try:
+        sim.next_level()
+        assert sim.scroll_speed == 6.25
+        gaps = set()
+        while sim.game_active and sim.current_level == 2:
+            sim.step(False, False)
+            xs = sorted(ob.rect.x for ob in sim.obstacles)
+            gaps.update(b - a for a, b in zip(xs, xs[1:]))
+        assert gaps == {spacing}
+    finally:
+        levels.close()
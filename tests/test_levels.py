@@ -0,0 +1,31 @@
+"""La generación por trozos (con y sin hilo productor) da los mismos
+obstáculos, tick a tick, que la generación en el bucle de juego."""
+import pytest
+
+from gd.bot import ScriptedBot
+from gd.core import Simulation
+from gd.levels import ChunkedLevels
+from gd.presets import get_preset, preset_names
+
+
+def snapshot(sim):
+    obstacles = [(ob.kind, ob.rect.x, ob.rect.width, ob.rect.height) for ob in sim.obstacles]
+    return sim.current_level, sim.distance, sim.game_active, obstacles
+
+
+@pytest.mark.parametrize("background", [False, True])
+@pytest.mark.parametrize("preset", preset_names())
+def test_chunked_matches_inline(preset, background):
+    config = get_preset(preset)
+    levels = ChunkedLevels(config, background=background)
+    try:
+        inline = Simulation(config, seed=11)
+        chunked = Simulation(config, seed=11, levels=levels)
+        bot = ScriptedBot(config)
+        for _ in range(6000):
+            jump = bot(inline)
+            inline.step(jump, True)
+            chunked.step(jump, True)
+            assert snapshot(chunked) == snapshot(inline)
+    finally:
+        levels.close()
@@ -0,0 +1,39 @@
+"""Percentiles por rango más cercano y traza del perfilador por fases."""
+import csv
+import json
+
+import pytest
+
+from gd.profiler import PHASES, FrameProfiler, percentile
+
+
+@pytest.mark.parametrize("q, expected", [(0, 1), (50, 5), (70, 7), (90, 9), (99, 10), (100, 10)])
+def test_percentile_nearest_rank(q, expected):
+    assert percentile(list(range(10, 0, -1)), q) == expected
+
+
+def test_percentile_window():
+    values = list(range(1, 1001))
+    assert percentile(values, 50) == 500
+    assert percentile(values, 99) == 990
+    assert percentile([], 99) == 0
+
+
+def test_stats_use_the_moving_window(tmp_path):
+    profiler = FrameProfiler(window=100, trace=True)
+    for frame in range(300):
+        profiler.frame = dict.fromkeys(PHASES, frame * 1000000)  # frame ms en cada fase
+        profiler.end_frame()
+    p50, p99 = profiler.stats()[PHASES[0]]
+    assert (p50, p99) == (249, 298)  # solo los frames 200..299
+    assert profiler.stats()["total"][0] == 249 * len(PHASES)
+
+    profiler.dump(str(tmp_path / "traza.csv"))
+    with open(tmp_path / "traza.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 301 and rows[0][-1] == "total_ns"
+    profiler.dump(str(tmp_path / "traza.json"))
+    with open(tmp_path / "traza.json") as f:
+        data = json.load(f)
+    assert len(data["frames"]) == 300
+    assert data["summary_ms"]["total"]["p99"] == 298 * len(PHASES)
@@ -0,0 +1,61 @@
+"""Las repeticiones se serializan sin pérdida y reproducen la misma partida."""
+import pytest
+
+from gd.bot import ScriptedBot
+from gd.core import Simulation
+from gd.engine import main
+from gd.presets import get_preset
+from gd.replay import Replay, ReplayError, ReplayRecorder, fast_forward, verify
+
+
+def record(preset, ticks=8000, seed=5):
+    config = get_preset(preset)
+    sim = Simulation(config, seed=seed)
+    recorder = ReplayRecorder(sim.rng.seed, config)
+    bot = ScriptedBot(config)
+    for tick in range(ticks):
+        jump = bot(sim)
+        restart = sim.show_game_over and tick % 7 == 0  # con game_over, "continuar" con retraso
+        recorder.record(jump, restart)
+        sim.step(jump, restart)
+    return sim, recorder.finish(sim)
+
+
+@pytest.mark.parametrize("preset", ["5.1", "5.3", "5.5", "5.6"])
+def test_round_trip_and_verify(preset, tmp_path):
+    sim, replay = record(preset)
+    path = tmp_path / "partida.gdr"
+    replay.save(str(path))
+    loaded = Replay.load(str(path))
+    assert (loaded.seed, loaded.config, loaded.runs) == (replay.seed, replay.config, replay.runs)
+    assert (loaded.ticks, loaded.level, loaded.best) == (replay.ticks, replay.level, replay.best)
+    assert verify(loaded)
+    again = fast_forward(loaded)
+    assert (again.ticks, again.distance, again.highscore) == (sim.ticks, sim.distance, sim.highscore)
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(b"GDLV" + bytes(40))
+
+
+def test_engine_rejects_bad_replay(tmp_path, capsys):
+    path = tmp_path / "rota.gdr"
+    path.write_bytes(b"GDRP")
+    assert main(argv=["--replay", str(path)]) == 1
+    assert capsys.readouterr().err.startswith("error:")
+
+
+@pytest.mark.parametrize("seed", ["-1", str(2 ** 64), "abc"])
+def test_engine_rejects_seed_out_of_range(seed):
+    with pytest.raises(SystemExit) as exc:
+        main(argv=["--seed", seed])
+    assert exc.value.code == 2
+
+
+def test_engine_fails_when_recording_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # puntajes y tabla de líderes aquí
+    argv = ["--autopilot", "--frames", "5", "--fps", "-1", "--seed", str(2 ** 64 - 1)]
+    assert main(argv=argv + ["--record", str(tmp_path / "ok.gdr")]) == 0
+    assert Replay.load(str(tmp_path / "ok.gdr")).seed == 2 ** 64 - 1
+    assert main(argv=argv + ["--record", str(tmp_path / "no" / "existe.gdr")]) == 1
@@ -0,0 +1,50 @@
+"""Récord atómico y tabla de líderes: lo escrito por el hilo de E/S se lee igual."""
+import os
+
+from gd.scores import Leaderboard, ScoreStore
+from gd.worker import IOWorker, atomic_write
+
+
+def test_atomic_write_replaces_and_keeps_mode(tmp_path):
+    path = str(tmp_path / "record.txt")
+    atomic_write(path, "10")
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o644)
+    os.chmod(path, 0o600)
+    atomic_write(path, b"25")
+    with open(path) as f:
+        assert f.read() == "25"
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert os.listdir(tmp_path) == ["record.txt"]  # sin temporales
+
+
+def test_leaderboard_top_filters_and_orders(tmp_path):
+    board = Leaderboard(str(tmp_path / "scores.db"))
+    try:
+        for profile, preset, level, distance in [
+                ("ana", "5.6", 1, 300), ("ana", "5.6", 2, 900), ("bea", "5.6", 1, 500),
+                ("bea", "5.4", 1, 4000)]:
+            board.add(profile, preset, level, distance, created=0)
+        assert [row[2] for row in board.top("5.6")] == [900, 500, 300]
+        assert [row[2] for row in board.top("5.6", level=1)] == [500, 300]
+        assert [row[2] for row in board.top("5.6", profile="ana", n=1)] == [900]
+    finally:
+        board.close()
+
+
+def test_score_store_writes_through_worker(tmp_path):
+    record = str(tmp_path / "record.txt")
+    db = str(tmp_path / "scores.db")
+    worker = IOWorker()
+    store = ScoreStore("ana", "5.6", record, db, worker=worker)
+    assert store.load_highscore() == 0
+    store.save_highscore(1234)
+    store.add_run(3, 1234.7)
+    store.close()
+    worker.close()
+    assert worker.errors == []
+    assert store.load_highscore() == 1234
+    board = Leaderboard(db)
+    try:
+        assert [row[:3] for row in board.top("5.6")] == [("ana", 3, 1234)]
+    finally:
+        board.close()
@@ -0,0 +1,43 @@
+"""La caché de textos renderiza cada tramo una sola vez y respeta su tamaño máximo."""
+import pygame
+import pytest
+
+from gd.text import TextCache
+
+
+@pytest.fixture(autouse=True)
+def fonts():
+    pygame.font.init()
+
+
+def test_only_new_digits_are_rendered():
+    cache = TextCache()
+    screen = pygame.Surface((400, 100))
+    cache.draw(screen, "Progreso: 120/1000", 38, 20, 12)
+    assert cache.misses == 5  # "Progreso: ", "1", "2", "0", "/"
+    cache.draw(screen, "Progreso: 120/1000", 38, 20, 12)
+    assert cache.misses == 5
+    cache.draw(screen, "Progreso: 135/1000", 38, 20, 12)
+    assert cache.misses == 7  # solo "3" y "5"
+    assert cache.hit_rate() == cache.hits / (cache.hits + cache.misses)
+
+
+def test_draw_returns_the_drawn_rect():
+    cache = TextCache()
+    screen = pygame.Surface((400, 100))
+    rect = cache.draw(screen, "Nivel 12", 30, 200, 50, center=True)
+    width = sum(cache.render(seg, 30).get_width() for seg in ("Nivel ", "1", "2"))
+    assert rect.width == width
+    assert rect.centerx in (200, 200 - 1)
+
+
+def test_lru_eviction():
+    cache = TextCache(max_entries=2)
+    a = cache.render("a", 20)
+    cache.render("b", 20)
+    assert cache.render("a", 20) is a  # "a" pasa a ser la más reciente
+    cache.render("c", 20)  # desaloja "b"
+    assert set(key[0] for key in cache.surfaces) == {"a", "c"}
+    assert cache.stats()["entries"] == 2
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.hits == cache.misses == 0
@@ -0,0 +1,45 @@
+"""El hilo de E/S hace los trabajos en orden, anota los errores y las esperas."""
+import threading
+
+import pytest
+
+from gd.worker import IOWorker
+
+
+def test_runs_jobs_in_order_and_collects_errors():
+    worker = IOWorker()
+    done = []
+
+    def fail():
+        raise OSError("disco lleno")
+
+    worker.submit(done.append, 1)
+    worker.submit(fail)
+    worker.submit(done.append, 2)
+    worker.close()
+    worker.close()  # idempotente
+    assert done == [1, 2]
+    assert [str(exc) for exc in worker.errors] == ["disco lleno"]
+    with pytest.raises(RuntimeError):
+        worker.submit(done.append, 3)
+
+
+def test_full_queue_stalls_instead_of_dropping():
+    worker = IOWorker(maxsize=1)
+    started = threading.Event()
+    gate = threading.Event()
+    done = []
+
+    def block():
+        started.set()
+        gate.wait()
+
+    worker.submit(block)
+    started.wait()  # el hilo queda bloqueado en este trabajo
+    worker.submit(done.append, 1)  # llena la cola
+    threading.Timer(0.05, gate.set).start()
+    worker.submit(done.append, 2)  # espera a que haya sitio
+    worker.close()
+    assert done == [1, 2]
+    assert worker.stalls == 1
+    assert worker.stall_ms > 0